@@ -0,0 +1,372 @@
+HELP_DOC = """
+BRUTE FORCE CHECK
+(version 1.0)
+by Angelo Chan
+
+This is a program for checking the engines of the Exhaustive Pairwise
+Permutation Test against a brute force enumeration of every relabelling.
+
+Comparisons between two small groups of random values are generated. For each
+one, every way of splitting the pooled values into two groups of the original
+sizes is evaluated directly, and the probability values of the Frequentist,
+Standard Deviation and Rank Sum tests are calculated from them. The same
+comparison is then run through every engine of the Exhaustive Pairwise
+Permutation Test, which must give the same probability values.
+
+The exact engines must agree with the brute force enumeration to within
+rounding. The Edgeworth engine only approximates the probability value for
+larger comparisons, and must agree to within EDGEWORTH_TOLERANCE.
+
+The values are rounded, so that there are ties and the Dynamic Programming
+engine can be used. The values for the Edgeworth engine are not rounded as
+much, and the groups are larger and of similar sizes, which is what the
+approximation is intended for.
+
+
+
+USAGE:
+
+    python27 Brute_Force_Check.py [<cases>] [<seed>]
+
+
+
+MANDATORY:
+
+    None
+
+
+
+OPTIONAL:
+
+    cases
+    
+        (DEFAULT: 200)
+    
+        The number of random comparisons to check.
+    
+    seed
+    
+        (DEFAULT: 0)
+    
+        The seed for the random number generator.
+
+
+
+EXAMPLES:
+
+    python27 Brute_Force_Check.py
+    python27 Brute_Force_Check.py 1000 7
+"""
+
+
+
+# Configurations ###############################################################
+
+MAX_GROUP = 6 # The most values in each group
+EDGEWORTH_MIN_GROUP = 6 # The fewest values in each group, for Edgeworth
+EDGEWORTH_MAX_GROUP = 8 # The most values in each group, for Edgeworth
+
+TOLERANCE = 1e-9 # Largest difference allowed for the exact engines
+EDGEWORTH_TOLERANCE = 0.075 # Largest difference allowed for Edgeworth
+
+BLOCK_SIZE = 7 # Small, so that relabellings are evaluated in several blocks
+
+
+
+# Defaults #####################################################################
+
+DEFAULT__cases = 200
+DEFAULT__seed = 0
+
+
+
+# Imports ######################################################################
+
+import itertools
+import random
+import sys
+
+import Exhaustive_Pairwise_Permutation_Test as EPPT
+
+
+
+# Strings ######################################################################
+
+STR__mismatch = "MISMATCH: {t} test, {e} engine, directional={d}\n"\
+        "\t{v1}\n\t{v2}\n\tExpected: {x}\n\tObtained: {o}"
+
+STR__engine = "{n:<12}{t:<20}{e:<16}{c:>6}"
+STR__header = STR__engine.format(n = "Engine", t = "Test",
+        e = "Largest error", c = "Cases")
+
+STR__passed = "\nAll engines agree with the brute force enumeration."
+STR__failed = "\n{n} comparisons did not agree with the brute force "\
+        "enumeration."
+
+
+
+# Lists ########################################################################
+
+LIST__engines = [
+        ["P", EPPT.ENGINE.PERMUTATOR],
+        ["C", EPPT.ENGINE.COMBINATIONS],
+        ["A", EPPT.ENGINE.ANALYTIC],
+        ["N", EPPT.ENGINE.NUMPY],
+        ["G", EPPT.ENGINE.GRAY_CODE],
+        ["D", EPPT.ENGINE.DYNAMIC],
+        ["M", EPPT.ENGINE.MIDDLE],
+        ["E", EPPT.ENGINE.EDGEWORTH]]
+
+LIST__tests = [
+        ["Frequentist", EPPT.TEST.FREQ],
+        ["Standard Deviation", EPPT.TEST.SDEV],
+        ["Rank Sum", EPPT.TEST.RANK]]
+
+
+
+# Functions ####################################################################
+
+def Brute_Force_Check(cases, seed):
+    """
+    Check every engine against a brute force enumeration, for @cases random
+    comparisons. Print the largest error of each engine and test type, and any
+    comparisons which did not agree.
+    
+    Return 0 if every comparison agreed, and 1 otherwise.
+    
+    @cases
+            (int)
+            The number of random comparisons to check.
+    @seed
+            (int)
+            The seed for the random number generator.
+    
+    Brute_Force_Check(int, int) -> int
+    """
+    rng = random.Random(seed)
+    errors = {} # [engine, test] : [largest error, cases]
+    failures = 0
+    for case in range(cases):
+        values_1, values_2 = Random_Groups(rng, 1, MAX_GROUP, [0, 1])
+        directional = rng.random() < 0.5
+        for name, test_type in LIST__tests:
+            expected = Brute_Force_P_Value(values_1, values_2, test_type,
+                    directional)
+            for letter, engine in LIST__engines:
+                if engine == EPPT.ENGINE.NUMPY and EPPT.CRUDE_Z_TEST: continue
+                if engine == EPPT.ENGINE.EDGEWORTH and (test_type ==
+                        EPPT.TEST.FREQ) and (len(values_1 + values_2) >=
+                        EPPT.EDGEWORTH_MIN_VALUES): continue # Approximated
+                obtained = Engine_P_Value(values_1, values_2, test_type,
+                        directional, engine)
+                error = abs(obtained - expected)
+                if not Record(errors, letter, name, error, TOLERANCE):
+                    failures += 1
+                    print(STR__mismatch.format(t = name, e = letter,
+                            d = directional, v1 = values_1, v2 = values_2,
+                            x = expected, o = obtained))
+    # Edgeworth approximations of larger comparisons
+    for case in range(cases):
+        values_1, values_2 = Random_Groups(rng, EDGEWORTH_MIN_GROUP,
+                EDGEWORTH_MAX_GROUP, [3])
+        expected = Brute_Force_P_Value(values_1, values_2, EPPT.TEST.FREQ,
+                True)
+        obtained = Engine_P_Value(values_1, values_2, EPPT.TEST.FREQ, True,
+                EPPT.ENGINE.EDGEWORTH)
+        error = abs(obtained - expected)
+        if not Record(errors, "E", "Approximation", error,
+                EDGEWORTH_TOLERANCE):
+            failures += 1
+            print(STR__mismatch.format(t = "Approximation", e = "E",
+                    d = True, v1 = values_1, v2 = values_2, x = expected,
+                    o = obtained))
+    # Report
+    print(STR__header)
+    for key in sorted(errors):
+        error, count = errors[key]
+        print(STR__engine.format(n = key[0], t = key[1],
+                e = "%.3g" % error, c = count))
+    if failures:
+        print(STR__failed.format(n = failures))
+        return 1
+    print(STR__passed)
+    return 0
+
+def Random_Groups(rng, smallest, largest, decimals):
+    """
+    Return two groups of random values, with between @smallest and @largest
+    values in each group. The first group is shifted upwards by a random
+    amount. The values are rounded to one of the numbers of decimal places in
+    @decimals, and are never all the same.
+    
+    @rng
+            (random.Random)
+            The random number generator.
+    @smallest
+            (int)
+            The fewest values in each group.
+    @largest
+            (int)
+            The most values in each group.
+    @decimals
+            (list<int>)
+            The numbers of decimal places the values can be rounded to.
+    
+    Random_Groups(random.Random, int, int, list<int>) ->
+            [list<float>, list<float>]
+    """
+    len_1 = rng.randint(smallest, largest)
+    length = len_1 + rng.randint(smallest, largest)
+    shift = rng.random() * 2
+    decimals = rng.choice(decimals)
+    values = [0.0]
+    while len(set(values)) == 1: # Identical values have no spread to test
+        values = []
+        for i in range(length):
+            value = rng.gauss(0, 2)
+            if i < len_1: value += shift
+            values.append(round(value, decimals))
+    return [values[:len_1], values[len_1:]]
+
+def Brute_Force_P_Value(values_1, values_2, test_type, directional):
+    """
+    Return the p-value of a comparison, calculated by evaluating every way of
+    splitting the pooled values into two groups of the original sizes.
+    
+    The differences are the average of the group which had the larger average
+    originally, minus that of the other group. As in the Exhaustive Pairwise
+    Permutation Test, a Frequentist test counts the differences at least as
+    large as the original, and a Standard Deviation test uses their population
+    standard deviation. A Rank Sum test compares the average ranks instead,
+    and counts the differences at least as far from 0 as the original if the
+    test is not directional.
+    
+    @values_1
+            (list<float>)
+            The values of the first group.
+    @values_2
+            (list<float>)
+            The values of the second group.
+    @test_type
+            (int - ENUM)
+            The type of test.
+    @directional
+            (bool)
+            Whether or not the test is a directional one.
+    
+    Brute_Force_P_Value(list<float>, list<float>, int, bool) -> float
+    """
+    len_1 = len(values_1)
+    len_2 = len(values_2)
+    values = values_1 + values_2
+    if test_type == EPPT.TEST.RANK:
+        # Doubled ranks, compared as whole numbers so there is no rounding
+        ranks = []
+        for value in values:
+            below = len([v for v in values if v < value])
+            equal = len([v for v in values if v == value])
+            ranks.append((2 * below) + equal + 1)
+        original = (sum(ranks[:len_1]) * len_2) - (sum(ranks[len_1:]) *
+                len_1)
+        count = 0
+        total = 0
+        for group in itertools.combinations(range(len(values)), len_1):
+            sum_1 = sum([ranks[i] for i in group])
+            scaled = (sum_1 * len_2) - ((sum(ranks) - sum_1) * len_1)
+            if directional and original > 0: extreme = scaled >= original
+            elif directional: extreme = scaled <= original
+            else: extreme = abs(scaled) >= abs(original)
+            if extreme: count += 1
+            total += 1
+        return float(count)/total
+    # Differences
+    difference = (sum(values_1)/len_1) - (sum(values_2)/len_2)
+    if difference > 0: sign = 1
+    else: sign = -1
+    differences = []
+    for group in itertools.combinations(range(len(values)), len_1):
+        sum_1 = sum([values[i] for i in group])
+        differences.append(sign * ((sum_1/len_1) -
+                ((sum(values) - sum_1)/len_2)))
+    if test_type == EPPT.TEST.FREQ:
+        threshold = abs(difference) - (EPPT.TOLERANCE *
+                max([abs(value) for value in values]))
+        count = len([d for d in differences if d >= threshold])
+        return float(count)/len(differences)
+    mean = sum(differences)/len(differences)
+    variance = sum([(d - mean) ** 2 for d in differences])/len(differences)
+    return EPPT.Calculate_P_Value__SD(abs(difference), variance ** 0.5,
+            directional)
+
+def Engine_P_Value(values_1, values_2, test_type, directional, engine):
+    """
+    Return the p-value of a comparison, as calculated by an engine of the
+    Exhaustive Pairwise Permutation Test, without a budget, so that every
+    relabelling is evaluated unless the engine calculates the p-value directly.
+    
+    @values_1
+            (list<float>)
+            The values of the first group.
+    @values_2
+            (list<float>)
+            The values of the second group.
+    @test_type
+            (int - ENUM)
+            The type of test.
+    @directional
+            (bool)
+            Whether or not the test is a directional one.
+    @engine
+            (int - ENUM)
+            The engine used.
+    
+    Engine_P_Value(list<float>, list<float>, int, bool, int) -> float
+    """
+    results = EPPT.Permutation_Test(values_1, values_2, test_type,
+            directional, engine, BLOCK_SIZE, EPPT.DEFAULT__draws, None, 0)
+    return results[0]
+
+def Record(errors, engine, test, error, tolerance):
+    """
+    Record the error of one comparison under @engine and @test in @errors, and
+    return whether or not it was within @tolerance.
+    
+    @errors
+            (dict<[str, str] : [float, int]>)
+            The largest error and number of comparisons of each engine and
+            test.
+    @engine
+            (str)
+            The letter of the engine.
+    @test
+            (str)
+            The name of the test.
+    @error
+            (float)
+            The absolute difference between the p-values.
+    @tolerance
+            (float)
+            The largest error allowed.
+    
+    Record(dict<[str, str] : [float, int]>, str, str, float, float) -> bool
+    """
+    key = (engine, test)
+    largest, count = errors.get(key, [0.0, 0])
+    errors[key] = [max(largest, error), count + 1]
+    return error <= tolerance
+
+
+
+# Main Loop ####################################################################
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ["-h", "--help"]:
+        print(HELP_DOC)
+        sys.exit(0)
+    try:
+        cases = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT__cases
+        seed = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT__seed
+    except ValueError:
+        print(HELP_DOC)
+        sys.exit(1)
+    sys.exit(Brute_Force_Check(cases, seed))
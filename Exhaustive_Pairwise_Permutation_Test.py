@@ -10,8 +10,8 @@ experiment, a series of round-robin pairwise analyses will be performed. Every
 group will be compared against all other groups.
 
 The tests being performed can either be a frequentist pairwise permutation test,
-(Possibly known by other names) or a standard deviation estimation permutation
-test.
+(Possibly known by other names) a standard deviation estimation permutation
+test, or a rank sum permutation test.
 
 A frequentist pairwise permutation test calculates the differences between all
 possible group ID shuffling permutations and finds the percentage of them in
@@ -21,6 +21,12 @@ A standard deviation estimation permutation test calculates the average and the
 standard deviation of the group mean differences for all shuffling permutations
 of the group IDs, and calculates a p-value based on this.
 
+A rank sum permutation test (Mann-Whitney) replaces the values with their ranks
+and finds the percentage of all group ID shuffling permutations in which the
+rank sum was at least as extreme as that of using the original group IDs. If
+there are no tied values, this only depends on the sizes of the groups, so the
+percentages for each pair of group sizes are only calculated once.
+
 It must be noted that these are not true p-values, and should not be taken as
 such. Permutation tests are usually employed when the the conditions required
 for more conventional statistical methods are not met. They allow users to at
@@ -29,7 +35,8 @@ least have some kind of objective number to use, which is better than nothing.
 
 
 The output file will be a TSV. Each row will contain the results of the
-comparison(s) between two groups in an experiment. The columns will be:
+comparison(s) between two groups in an experiment. Each pair of groups is
+compared once. The columns will be:
     - Experiment ID
     - Group ID 1 (first group in comparison)
     - Group ID 2 (second group in comparison)
@@ -37,8 +44,38 @@ comparison(s) between two groups in an experiment. The columns will be:
         - Each result comprises two values and thus two columns.
         - The first column gives the probability value.
         - The second column gives the group ID of the higher value group.
+        - If either group has no values in a data column, the result will be
+          NA.
+        - If the Monte Carlo option (-m) is used, each result comprises five
+          values instead. In order, they are the probability value, the
+          standard error of the probability value, the method used, the number
+          of relabellings evaluated, and the group ID of the higher value
+          group. The possible methods are:
+            EXHAUSTIVE  - All possible relabellings were evaluated.
+            ANALYTIC    - The probability value was calculated directly.
+            EDGEWORTH   - The probability value was approximated directly.
+            MONTE_CARLO - Randomly drawn relabellings were evaluated.
+            SEQUENTIAL  - Randomly drawn relabellings were evaluated until
+                          enough of them were at least as extreme as the
+                          original.
+        - The same applies if the sequential option (-q) or the Edgeworth
+          engine is used.
     - (All extra information which the user specified should be kept)
 
+If the binary option (-y) is used, the output file is instead a compact binary
+file, which can be converted into the TSV described above with the -convert
+option. The binary file contains:
+    - A header: "PPTR", the format version, the number of values in each result
+      (2 or 5), and the number of data columns.
+    - One record per row, made up of the experiment index, the group 1 index,
+      and the group 2 index, followed by each result. A result is the
+      probability value, (Standard error, method number, and number of
+      relabellings evaluated, if the result has five values) and a number
+      denoting the higher value group. (1 or 2, 0 if NA) Probability values
+      and standard errors which are NA are stored as NaN.
+    - A footer, which contains the experiment IDs, group IDs, extra
+      information and header row, followed by the position of the footer.
+
 
 
 USAGE:
@@ -46,7 +83,19 @@ USAGE:
     python27 Exhaustive_Pairwise_Permutation_Test.py <input_file>
             <{input_format}> <col_no_exp_id> <col_no_group_id> <col_nos_data>
             [-o <output_file>] [-t <{test_type}>] [-d <directional>]
-            [-h <{header}> <{keep}>] [-k <col_nos_keep>]
+            [-h <{header}> <{keep}>] [-k <col_nos_keep>] [-e <{engine}>]
+            [-b <block_size>] [-m <draws> <budget>] [-r <seed>]
+            [-q <exceedances>] [-s <resolutions>] [-c <cache_size>]
+            [-f <cache_file>] [-j <processes>] [-w <workers>]
+            [-p <queue_depth>] [-u <unsorted>] [-i <index_file>]
+            [-l <experiment_IDs>] [-a <columnar_cache>] [-y <binary>]
+            [-z <resume>] [-x <results_store>] [-n <shard>]
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py -convert <binary_file>
+            [<output_file>]
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py -merge <output_file>
+            <shard_output_file> [<shard_output_file> ...]
 
 
 
@@ -55,6 +104,10 @@ MANDATORY:
     input_path
         
         The filepath of the input file.
+        
+        Alternatively, the filepath of a columnar cache folder. (See the
+        columnar_cache option) The input file the cache was built from is then
+        used as the input file, and the cache is used to read it.
     
     input_format
         
@@ -102,6 +155,13 @@ OPTIONAL:
         The type of test to perform. Acceptable options are:
             F - Frequentist
             S - Standard Deviation
+            R - Rank Sum
+        
+        For rank sum tests, the higher value group is the one with the higher
+        average rank, and the engine, Monte Carlo and sequential options are
+        not used. The probability values are counted exactly, using up to 32
+        MB of memory per comparison, in each process. Larger comparisons use
+        the normal approximation instead.
     
     directional
         
@@ -134,6 +194,287 @@ OPTIONAL:
         
         Note that the column system uses the 1-index system. (The first column
         is column 1)
+    
+    engine
+        
+        (DEFAULT: C)
+        
+        The method used to generate all the possible relabellings of the two
+        groups being compared. Acceptable options are:
+            P - Permutator (Shuffles the group IDs themselves. Slow.)
+            C - Combinations (Enumerates which samples belong to the first
+                group, without generating duplicate relabellings.)
+            A - Analytic (Standard Deviation tests only. Calculates the
+                standard deviation of all relabellings directly, without
+                generating them. Frequentist tests will use Combinations.)
+            N - NumPy (Same as Combinations, but evaluates the relabellings in
+                large blocks using NumPy. Data columns with missing values in
+                the same samples share their relabellings, and are evaluated
+                together as a single matrix multiplication. Not available if
+                CRUDE_Z_TEST is enabled.)
+            G - Gray Code (Same as Combinations, but each relabelling differs
+                from the previous one by a single swap, and the group totals
+                are built from tables of smaller relabellings rather than
+                recalculated. Several times faster than Combinations. Use
+                this instead of NumPy if CRUDE_Z_TEST is enabled.)
+            D - Dynamic Programming (Frequentist tests only. Counts how many
+                relabellings give each possible total for the first group,
+                without generating them. Only usable for data which are
+                multiples of a fixed resolution, such as counts. Uses up to
+                32 MB of memory per comparison, in each process. Other data,
+                comparisons which would need more memory or could have more
+                than 2^63 relabellings, and Standard Deviation tests, will use
+                Combinations.)
+            M - Meet in the Middle (Frequentist tests only. Splits the pooled
+                values into two halves, lists the totals of every subset of
+                each half, and counts the relabellings at least as extreme as
+                the original by searching the sorted totals, without
+                generating them. Much faster than Combinations for pooled
+                groups of up to about 40 values, and usable for up to 44
+                values, using up to 64 MB of memory per comparison, in each
+                process. Larger pooled groups, and Standard Deviation tests,
+                will use Combinations.)
+            E - Edgeworth (Frequentist tests only. Approximates the
+                probability value from the first four cumulants of the totals
+                of all relabellings, which are calculated directly from the
+                pooled values, without generating any relabellings. Only used
+                for comparisons with more possible relabellings than the
+                budget, or for all comparisons if there is no budget, and
+                only if the two groups have at least 10 values between them.
+                Other comparisons, and Standard Deviation tests, will use
+                Combinations. The output will show which method was used for
+                each comparison.)
+    
+    block_size
+        
+        (DEFAULT: 100000)
+        
+        The number of relabellings evaluated together in each block. Larger
+        blocks use more memory. For the NumPy engine, larger blocks are also
+        faster.
+    
+    draws
+        
+        (DEFAULT: 10000)
+        
+        The number of random relabellings to evaluate for any comparison which
+        has more possible relabellings than the budget. Must be specified
+        together with the budget.
+    
+    budget
+        
+        (DEFAULT: None)
+        
+        The largest number of possible relabellings a comparison can have for
+        all of them to be evaluated. Comparisons with more possible
+        relabellings than this will instead have a number of randomly drawn
+        relabellings evaluated. (Monte Carlo) If no budget is specified, all
+        possible relabellings will always be evaluated.
+        
+        For Frequentist tests, the probability value is then the number of
+        drawn relabellings at least as extreme as the original, plus one,
+        divided by the number of relabellings drawn, plus one. (The original
+        labelling counts as one of the draws, so the probability value is never
+        0)
+    
+    seed
+        
+        (DEFAULT: 1)
+        
+        The seed for the random number generator, which is used to draw random
+        relabellings. Every comparison draws from its own sequence of random
+        numbers, derived from this seed, the experiment ID, the group IDs, and
+        the data column. Must be a positive integer.
+    
+    exceedances
+        
+        (DEFAULT: None)
+        
+        (Frequentist tests only)
+        
+        The number of randomly drawn relabellings which must be at least as
+        extreme as the original for sampling to stop. (Sequential Monte Carlo)
+        If specified, comparisons which would otherwise use Monte Carlo, or
+        which have more possible relabellings than the number of draws if no
+        budget is specified, will draw random relabellings one at a time until
+        this many of them were at least as extreme as the original, or until
+        the number of draws is reached. If sampling stopped early, the
+        probability value is the number of exceedances divided by the number
+        of relabellings drawn. Otherwise, it is the number of extreme
+        relabellings, plus one, divided by the number of draws. (Besag and
+        Clifford) Comparisons which are clearly not significant stop very
+        early.
+    
+    resolutions
+        
+        (DEFAULT: None)
+        
+        (Dynamic Programming engine only)
+        
+        A comma separated list of the resolutions of the data columns, in the
+        same order as the data columns. (Ex. 1 for counts, 0.01 for values with
+        two decimal places) If only one resolution is specified, it is used
+        for all the data columns. If no resolutions are specified, the
+        resolution of each comparison is detected, if the values have no more
+        than 6 decimal places. Comparisons whose values are not multiples of
+        their resolution will use Combinations.
+    
+    cache_size
+        
+        (DEFAULT: 10000)
+        
+        The number of exact results to keep in memory. Comparisons between the
+        same pooled values, split into groups of the same sizes, have the same
+        result, regardless of the order of the values or of the groups. (Ex.
+        Replicated data columns, or the same groups compared in different
+        experiments) Each result is calculated once and then reused. When the
+        cache is full, the least recently used result is discarded. Results
+        estimated from random relabellings are never kept.
+    
+    cache_file
+        
+        (DEFAULT: None)
+        
+        The filepath of a file in which to keep the cached results between
+        runs. If the file exists, its results are loaded before the
+        comparisons begin, and the cache is written back into it once all the
+        comparisons are finished.
+    
+    processes
+        
+        (DEFAULT: 1)
+        
+        The number of processes to use. If more than 1, experiments are
+        analyzed in parallel by a pool of worker processes. Results are still
+        written in the same order as the experiments in the input file. Each
+        worker process keeps its own cache, starting from the results in the
+        cache file, and the results it calculates are added to the main cache.
+    
+    workers
+        
+        (DEFAULT: 1)
+        
+        The number of worker processes which share the work of each single
+        comparison. If more than 1, the relabellings of every comparison which
+        will be evaluated exhaustively, and which are too many to be evaluated
+        as a single range, are split into ranges which are evaluated in
+        parallel. The results are the same regardless of the number of
+        workers. This only applies to the Permutator, Combinations, and NumPy
+        engines. This option cannot be used together with the processes
+        option.
+    
+    queue_depth
+        
+        (DEFAULT: None)
+        
+        If specified, the input file is read, and the output file written, by
+        separate threads while the comparisons are being performed. Up to this
+        many experiments are read ahead, and the results of up to this many
+        experiments are waiting to be written, at any one time. Useful when
+        the files are on a slow or network file system.
+    
+    unsorted
+        
+        (DEFAULT: N)
+        
+        Whether or not the rows of an experiment can be spread out across the
+        input file, instead of being consecutive. If so, the input file is
+        first read once to build an index of where the rows of each experiment
+        are, and the rows of each experiment are then read together. The
+        experiments are analyzed in the order in which they first appear in
+        the input file.
+    
+    index_file
+        
+        (DEFAULT: None)
+        
+        The filepath of a file in which to keep the index of an unsorted input
+        file between runs, such as the filepath of the input file followed by
+        ".index". If the file exists, and the input file has not changed since
+        it was written, the index is loaded instead of being built again.
+        Implies that the input file is unsorted.
+    
+    experiment_IDs
+        
+        (DEFAULT: None)
+        
+        A comma separated list of experiment IDs. If specified, only these
+        experiments are analyzed, in the order given. Implies that the input
+        file is unsorted.
+    
+    columnar_cache
+        
+        (DEFAULT: None)
+        
+        The filepath of a folder in which to keep a binary, column by column,
+        copy of the input file, for faster reading in later runs. The folder
+        is created, and the copy made, the first time. The copy is made again
+        if the input file, the input file format, the experiment ID column or
+        the group ID column changes. Every column of numbers in the input file
+        is kept, so later runs can analyze different data columns. Requires
+        NumPy.
+    
+    binary
+        
+        (DEFAULT: N)
+        
+        Whether or not to write the results in a compact binary format instead
+        of as a TSV. Requires an output file. The binary file can be converted
+        into a TSV with:
+            
+            python27 Exhaustive_Pairwise_Permutation_Test.py -convert
+                    <binary_file> [<output_file>]
+        
+        If no output file is specified for the conversion, the TSV is printed.
+    
+    resume
+        
+        (DEFAULT: N)
+        
+        Whether or not to resume an interrupted run. Requires an output file.
+        
+        While running, a journal file (The filepath of the output file followed
+        by ".journal") is kept, and regularly updated with how far the run has
+        gotten. If resuming, the run continues from where the journal says it
+        was up to, instead of from the first experiment, and the output file is
+        added to instead of being overwritten. All other options must be the
+        same as those of the interrupted run. The journal file is deleted once
+        the run is finished.
+    
+    results_store
+        
+        (DEFAULT: None)
+        
+        The filepath of a file in which to keep the results of every experiment
+        between runs. Each experiment's results are stored under a hash of its
+        data and of the options which affect the results. (The test type,
+        directionality, columns, engine, and so on) When the input file is
+        analyzed again, experiments whose data has not changed are not analyzed
+        again, and their stored results are used instead. The output is the
+        same as if every experiment had been analyzed.
+        
+        Only the results of the experiments in the latest run are kept.
+    
+    shard
+        
+        (DEFAULT: None)
+        
+        Which share of the experiments to analyze, written as "i/N", to split
+        one input file between N separate runs. (On different computers, for
+        example) Each experiment belongs to exactly one of the shards 1 to N,
+        according to a hash of its experiment ID, so runs with the same N
+        always agree on which experiments belong to which shard.
+        
+        If there is an output file, a summary of the shard is written
+        alongside it. (The filepath of the output file followed by ".shard")
+        The output files of all N shards can then be combined into one file,
+        in the same order as an unsharded run, with:
+            
+            python27 Exhaustive_Pairwise_Permutation_Test.py -merge
+                    <output_file> <shard_output_file> [...]
+        
+        The summaries must be in the same folder as the shard output files.
+        The metrics of all the shards are added together and reported.
 
 
 
@@ -154,6 +495,20 @@ EXAMPLES EXPLANATION:
     The experiment ID is in column 2. The group IDs are in column 3. We want to
     compare the data in column 1. The comparison being performed is a Standard
     Deviation one.
+    
+    4:
+    The experiment ID is in column 2. The group IDs are in column 3. We want to
+    compare the data in column 1. The comparison being performed is a
+    Frequentist one. Any comparison with more than a million possible
+    relabellings will have 100,000 randomly drawn relabellings evaluated
+    instead.
+    
+    5:
+    The experiment ID is in column 2. The group IDs are in column 3. We want to
+    compare the data in column 1. The comparison being performed is a
+    Frequentist one. Any comparison with more than 100,000 possible
+    relabellings will have random relabellings drawn until 10 of them are at
+    least as extreme as the original, up to a maximum of 100,000.
 
 EXAMPLES:
     
@@ -165,13 +520,43 @@ EXAMPLES:
     
     python27 Exhaustive_Pairwise_Permutation_Test.py example_data.tsv tsv 2 3 1
             -t SD
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py example_data.tsv tsv 2 3 1
+            -t F -m 100000 1000000
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py example_data.tsv tsv 2 3 1
+            -t F -m 100000 100000 -q 10
+
+    python27 Exhaustive_Pairwise_Permutation_Test.py -convert output_file.bin
+            output_file.tsv
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py example_data.tsv tsv 2 3 1
+            -o output_1.tsv -n 1/2
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py example_data.tsv tsv 2 3 1
+            -o output_2.tsv -n 2/2
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py -merge output_file.tsv
+            output_1.tsv output_2.tsv
 
 USAGE:
     
     python27 Exhaustive_Pairwise_Permutation_Test.py <input_file>
             <{input_format}> <col_no_exp_id> <col_no_group_id> <col_nos_data>
             [-o <output_file>] [-t <{test_type}>] [-d <directional>]
-            [-h <{header}> <{keep}>] [-k <col_nos_keep>]
+            [-h <{header}> <{keep}>] [-k <col_nos_keep>] [-e <{engine}>]
+            [-b <block_size>] [-m <draws> <budget>] [-r <seed>]
+            [-q <exceedances>] [-s <resolutions>] [-c <cache_size>]
+            [-f <cache_file>] [-j <processes>] [-w <workers>]
+            [-p <queue_depth>] [-u <unsorted>] [-i <index_file>]
+            [-l <experiment_IDs>] [-a <columnar_cache>] [-y <binary>]
+            [-z <resume>] [-x <results_store>] [-n <shard>]
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py -convert <binary_file>
+            [<output_file>]
+    
+    python27 Exhaustive_Pairwise_Permutation_Test.py -merge <output_file>
+            <shard_output_file> [<shard_output_file> ...]
 """
 
 NAME = "Exhaustive_Pairwise_Permutation_Test.py"
@@ -191,6 +576,26 @@ PRINT_METRICS = True
 
 CRUDE_Z_TEST = False
 
+TOLERANCE = 1e-9 # Relative tolerance when comparing permutation differences
+
+MAX_DECIMALS = 6 # The most decimal places detected for Dynamic Programming
+MAX_DP_CELLS = 4194304 # The largest Dynamic Programming table (8 bytes/cell)
+MAX_MITM_SUBSETS = 4194304 # Most subset totals in each Meet in the Middle half
+GRAY_CODE_TABLE = 4096 # The most subset totals in each Gray Code table
+EDGEWORTH_MIN_VALUES = 10 # Fewer pooled values are evaluated exactly instead
+
+IN_FLIGHT_PER_PROCESS = 2 # Experiments queued for each worker process
+RANGE_BLOCKS = 16 # Blocks of relabellings in each range given to a worker
+
+READ_CHUNK_SIZE = 16777216 # Bytes read from the input file at once
+COLUMNAR_WINDOW = 65536 # Rows converted from a columnar cache at once
+
+OUTPUT_BUFFER_SIZE = 1048576 # Bytes buffered before writing to the output file
+BINARY_VERSION = 1 # Version of the binary results format
+BINARY_CHUNK = 65536 # Records converted from a binary results file at once
+
+JOURNAL_SECONDS = 60 # Time between updates of the journal file
+
 
 
 # Defaults #####################################################################
@@ -199,13 +604,56 @@ DEFAULT__test = 2 # STANDARD DEVIATIONS
 DEFAULT__directional = True
 DEFAULT__header = True
 DEFAULT__keep = True
+DEFAULT__engine = 2 # COMBINATIONS
+DEFAULT__block_size = 100000
+DEFAULT__draws = 10000
+DEFAULT__budget = None # Always exhaustive
+DEFAULT__seed = 1
+DEFAULT__exceedances = None # No early stopping
+DEFAULT__resolutions = None # Detect resolutions
+DEFAULT__cache_size = 10000
+DEFAULT__cache_path = None # Memory only
+DEFAULT__processes = 1
+DEFAULT__workers = 1
+DEFAULT__queue_depth = None # No separate reading and writing threads
+DEFAULT__unsorted = False
+DEFAULT__index_path = None # Index not saved
+DEFAULT__experiment_IDs = None # All experiments
+DEFAULT__columnar_path = None # No columnar cache
+DEFAULT__binary = False
+DEFAULT__resume = False
+DEFAULT__store_path = None # No results store
+DEFAULT__shard = None # All experiments
 
 
 
 # Imported Modules #############################################################
 
+import bisect
+import collections
+import hashlib
+import itertools
+import math
+import array
+import multiprocessing
+import os
+import pickle
+import random
+import struct
+import threading
+import time
+import zlib
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+
 if not CRUDE_Z_TEST:
     import scipy.stats
+    import numpy
 else:
     from Crude_Z_Test import *
 
@@ -214,12 +662,6 @@ else:
 import _Controlled_Print as PRINT
 from _Command_Line_Parser import *
 
-from File_Reader import *
-from Table_File_Reader import *
-from Subgrouped_Table_File_Reader import *
-
-from Simple_Permutator import *
-
 
 
 # Enums ########################################################################
@@ -227,6 +669,24 @@ from Simple_Permutator import *
 class TEST:
     FREQ=1
     SDEV=2
+    RANK=3
+
+class ENGINE:
+    PERMUTATOR=1
+    COMBINATIONS=2
+    ANALYTIC=3
+    NUMPY=4
+    GRAY_CODE=5
+    DYNAMIC=6
+    MIDDLE=7
+    EDGEWORTH=8
+
+class METHOD:
+    EXHAUSTIVE=1
+    ANALYTIC=2
+    MONTE_CARLO=3
+    SEQUENTIAL=4
+    EDGEWORTH=5
 
 
 
@@ -237,6 +697,80 @@ STR__use_help = "\nUse the -h option for help:\n\tpython "\
 
 STR__test_type = "\nERROR: Invalid test type:\n\t{s}"
 
+STR__engine = "\nERROR: Invalid engine:\n\t{s}"
+
+STR__engine_numpy = "\nERROR: The NumPy engine cannot be used when "\
+        "CRUDE_Z_TEST is enabled."
+
+STR__block_size = "\nERROR: Invalid block size:\n\t{s}"
+
+STR__monte_carlo = "\nERROR: Invalid number of draws or budget:\n\t{s} {t}"
+
+STR__seed = "\nERROR: Invalid seed:\n\t{s}"
+
+STR__exceedances = "\nERROR: Invalid number of exceedances:\n\t{s}"
+
+STR__resolutions = "\nERROR: Invalid resolutions:\n\t{s}"
+
+STR__cache_size = "\nERROR: Invalid cache size:\n\t{s}"
+
+STR__cache_read = "\nWARNING: Unable to read cache file. Starting with an "\
+        "empty cache:\n\t{f}"
+
+STR__cache_write = "\nWARNING: Unable to write cache file:\n\t{f}"
+
+STR__processes = "\nERROR: Invalid number of processes:\n\t{s}"
+STR__workers = "\nERROR: Invalid number of workers:\n\t{s}"
+STR__workers_exclusive = """
+ERROR: The processes (-j) and workers (-w) options cannot both be used."""
+STR__queue_depth = "\nERROR: Invalid queue depth:\n\t{s}"
+
+STR__experiment_IDs = "\nERROR: Invalid list of experiment IDs:\n\t{s}"
+STR__experiment_missing = "\nWARNING: Experiment not found in input file:"\
+        "\n\t{s}"
+
+STR__index_read = "\nWARNING: Unable to read index file. Building a new "\
+        "index:\n\t{f}"
+STR__index_write = "\nWARNING: Unable to write index file:\n\t{f}"
+
+STR__store_read = "\nWARNING: Unable to read results store. Analyzing every "\
+        "experiment:\n\t{f}"
+STR__store_write = "\nWARNING: Unable to write results store:\n\t{f}"
+
+STR__shard = "\nERROR: Invalid shard:\n\t{s}"
+STR__shard_write = "\nWARNING: Unable to write shard summary:\n\t{f}"
+STR__merge_read = "\nERROR: Unable to read shard output file, or its shard "\
+        "summary:\n\t{f}"
+STR__merge_shards = "\nERROR: The shard output files are not all the shards "\
+        "of one run."
+
+STR__columnar_read = "\nERROR: Unable to read columnar cache:\n\t{f}"
+STR__columnar_stale = "\nWARNING: Unable to read columnar cache. Building a "\
+        "new cache:\n\t{f}"
+STR__columnar_column = "\nERROR: Column {n} of the input file does not only "\
+        "contain numbers."
+STR__columnar_numpy = "\nERROR: The columnar cache requires NumPy."
+
+STR__binary_output = "\nERROR: An output file is needed for binary output."
+STR__binary_read = "\nERROR: Unable to read binary results file:\n\t{f}"
+
+STR__binary_magic = b"PPTR"
+
+STR__resume_output = "\nERROR: An output file is needed to resume a run."
+STR__journal_missing = "\nWARNING: No journal file found. Starting from the "\
+        "beginning:\n\t{f}"
+STR__journal_invalid = "\nERROR: The journal file is unreadable, or is for a "\
+        "run with different options:\n\t{f}"
+
+STR__journal_suffix = ".journal"
+STR__temp_suffix = ".tmp"
+STR__shard_suffix = ".shard"
+
+STR__file_meta = "meta.pkl"
+STR__file_groups = "groups.npy"
+STR__file_column = "column_{n}.npy"
+STR__file_missing = "missing_{n}.npy"
+
 
 
 STR__metrics = """
@@ -248,6 +782,14 @@ STR__metrics = """
 
                 Columns processed: {E}
     
+              Comparisons planned: {I}
+             Comparisons executed: {J}
+    
+                       Cache hits: {K}
+                     Cache misses: {L}
+    
+               Experiments reused: {M}
+    
     Average groups per experiment: {F}
      Average lines per experiment: {G}
     
@@ -270,6 +812,26 @@ LIST__standard_d = ["SD", "Sd", "sd", "S", "s", "STANDARDDEVIATION",
         "StandardDeviation", "standarddeviation", "STANDARD_DEVIATION",
         "Standard_Deviation", "standard_deviation", "STANDARD", "Standard",
         "standard", "SDEV", "SDev", "sdev", "S_DEV", "S_Dev", "s_dev"]
+LIST__rank_sum = ["R", "r", "RANK", "Rank", "rank", "RANKSUM", "RankSum",
+        "ranksum", "RANK_SUM", "Rank_Sum", "rank_sum", "MW", "mw",
+        "MANNWHITNEY", "MannWhitney", "mannwhitney"]
+
+LIST__permutator = ["P", "p", "PERMUTATOR", "Permutator", "permutator", "PERM",
+        "Perm", "perm"]
+LIST__combinations = ["C", "c", "COMBINATIONS", "Combinations", "combinations",
+        "COMB", "Comb", "comb"]
+LIST__analytic = ["A", "a", "ANALYTIC", "Analytic", "analytic"]
+LIST__numpy = ["N", "n", "NUMPY", "NumPy", "Numpy", "numpy"]
+LIST__gray_code = ["G", "g", "GRAY", "Gray", "gray", "GRAYCODE", "GrayCode",
+        "graycode", "GRAY_CODE", "Gray_Code", "gray_code"]
+LIST__dynamic = ["D", "d", "DYNAMIC", "Dynamic", "dynamic", "DP", "dp"]
+LIST__middle = ["M", "m", "MIDDLE", "Middle", "middle", "MITM", "mitm"]
+LIST__edgeworth = ["E", "e", "EDGEWORTH", "Edgeworth", "edgeworth"]
+
+LIST__ranged_engines = [1, 2, 4] # PERMUTATOR, COMBINATIONS, NUMPY
+
+LIST__convert = ["-convert", "--convert"]
+LIST__merge = ["-merge", "--merge"]
 
 
 
@@ -278,6 +840,24 @@ LIST__standard_d = ["SD", "Sd", "sd", "S", "s", "STANDARDDEVIATION",
 DICT__test = {}
 for i in LIST__frequentist: DICT__test[i] = TEST.FREQ
 for i in LIST__standard_d: DICT__test[i] = TEST.SDEV
+for i in LIST__rank_sum: DICT__test[i] = TEST.RANK
+
+DICT__engine = {}
+for i in LIST__permutator: DICT__engine[i] = ENGINE.PERMUTATOR
+for i in LIST__combinations: DICT__engine[i] = ENGINE.COMBINATIONS
+for i in LIST__analytic: DICT__engine[i] = ENGINE.ANALYTIC
+for i in LIST__numpy: DICT__engine[i] = ENGINE.NUMPY
+for i in LIST__gray_code: DICT__engine[i] = ENGINE.GRAY_CODE
+for i in LIST__dynamic: DICT__engine[i] = ENGINE.DYNAMIC
+for i in LIST__middle: DICT__engine[i] = ENGINE.MIDDLE
+for i in LIST__edgeworth: DICT__engine[i] = ENGINE.EDGEWORTH
+
+DICT__method_names = {
+    METHOD.EXHAUSTIVE: "EXHAUSTIVE",
+    METHOD.ANALYTIC: "ANALYTIC",
+    METHOD.MONTE_CARLO: "MONTE_CARLO",
+    METHOD.SEQUENTIAL: "SEQUENTIAL",
+    METHOD.EDGEWORTH: "EDGEWORTH"}
 
 
 
@@ -289,177 +869,1897 @@ PRINT.PRINT_METRICS = PRINT_METRICS
 
 
 
-# Functions ####################################################################
+# Classes ######################################################################
 
-def Exhaustive_Pairwise_Permutation_Test(path_in, delim, col_exp, col_grp,
-            col_data, path_out, test_type, directional, header, keep,
-            col_keep):
+class Frequentist_Accumulator:
     """
-    For each experiment, perform pairwise tests between the experimental groups.
-    
-    @path_in
-            (str - filepath)
-            The filepath of the input file.
-    @delim
-            (str)
-            The delimiter to be used for the left table file. File formats and
-            their corresponding delimiters are as follows:
-                TSV - "\t" (tab character)
-                CSV - ","  (comma character)
-                SSV - " "  (whitespace character)
-    @col_exp
-            (int)
-            The column number for the column containing the experiment IDs.
-            (Uses a 0-index system.)
-    @col_grp
-            (int)
-            The column number for the column containing the group IDs.
-            (Uses a 0-index system.)
-    @col_data
-            (list<int>)
-            A list of the column numbers for the columns which contain the
-            values to be analyzed.
-            (Uses a 0-index system.)
-    @path_out
-            (str - filepath) OR
-            (None)
-            The filepath of the file where the output will be written into.
-    @test_type
-            (int - ENUM)
-            An integer denoting what kind of test will be performed on the data.
-            The options are as follows:
-                1 - Frequentist
-                2 - Standard Deviation
-    @directional
-            (bool)
-            Whether or not the tests should be directional or not.
-    @header
-            (bool)
-            Whether or not there are headers in the input files.
-    @keep
-            (bool)
-            Whether or not to keep the headers, if they are present.
-    @col_keep
-            (list<int>)
-            A list of the column numbers for the columns which contain the
-            values to be kept as is. Note that only the values from the first
-            row of data from each experiment will be kept.
-            (Uses a 0-index system.)
+    Calculates the p-value of a Frequentist test, by keeping count of how many
+    of the permutation differences fed to it were at least as large as the
+    observed difference. The differences themselves are not stored.
     
-    Exhaustive_Pairwise_Permutation_Test(path_in, delim, col_exp, col_grp,
-            col_data, output_file, test_type, header, keep, col_keep)
+    Differences can be added one at a time, or in batches. (Lists or NumPy
+    arrays) Accumulators which were fed different differences for the same
+    observed difference can be merged.
     """
-    PRINT.printP(STR__report_begin)
+    def __init__(self, difference, directional, tolerance=0.0):
+        """
+        @difference
+                (float)
+                The actual difference observed.
+        @directional
+                (bool)
+                Whether or not the tests should be directional or not.
+        @tolerance
+                (float)
+                How much smaller than @difference a permutation difference can
+                be and still be counted as being at least as large.
+        """
+        if directional:
+            self.threshold = difference - tolerance
+        else:
+            self.threshold = abs(difference) - tolerance
+        self.count = 0
+        self.total = 0
     
-    # Setup - Metrics
-    count_total = 0
-    count_tests = 0
-    count_exp = 0
-    count_grp = 0
-    count_line = 0
+    def Add(self, permutation_dif):
+        """
+        Add one permutation difference.
+        """
+        if permutation_dif >= self.threshold:
+            self.count += 1
+        self.total += 1
     
-    # Setup - File I/O
-    f = Subgrouped_Table_Reader()
-    f.Set_New_Path(path_in)
-    f.Set_Delimiter(delim)
-    f.Set_Group_ID_Column_No(col_exp)
-    if header:
-        f.Set_Header_Params([1])
-    f.Open()
-    if path_out: o = open(path_out, "w")
-    else: o = None
+    def Add_Batch(self, differences):
+        """
+        Add a list, or NumPy array, of permutation differences.
+        """
+        threshold = self.threshold
+        if type(differences) == list:
+            count = 0
+            for i in differences:
+                if i >= threshold:
+                    count += 1
+        else:
+            count = int((differences >= threshold).sum())
+        self.count += count
+        self.total += len(differences)
     
-    # Setup - Others
-    cols = [col_exp] + [col_grp] + col_data
+    def Add_Batch_Until(self, differences, exceedances):
+        """
+        Add a list, or NumPy array, of permutation differences, one at a time,
+        stopping as soon as @exceedances of all the differences added so far
+        were at least as large as the observed difference. The rest of the
+        batch is discarded.
+        
+        Return True if the batch was stopped, and False otherwise.
+        """
+        threshold = self.threshold
+        needed = exceedances - self.count
+        if needed <= 0: return True
+        if type(differences) == list:
+            count = 0
+            index = 0
+            for i in differences:
+                index += 1
+                if i >= threshold:
+                    count += 1
+                    if count == needed: break
+        else:
+            counts = (differences >= threshold).cumsum()
+            if len(counts) and counts[-1] >= needed:
+                index = int(counts.searchsorted(needed)) + 1
+                count = needed
+            else:
+                index = len(differences)
+                count = int(counts[-1]) if len(counts) else 0
+        self.count += count
+        self.total += index
+        return self.count >= exceedances
     
-    # Header
-    if header and keep:
-        # Process string
-        header_str = f.Get_Header_Text()
-        headers = header_str.split(delim)
-        headers[-1] = headers[-1][:-1]
-        # Build
-        sb = Build_Header_String(headers, col_exp, col_grp, col_data, col_keep,
-                delim)
-        # Write
-        Controlled_Output(sb, o)
+    def Merge(self, other):
+        """
+        Add all the permutation differences which were added to another
+        Frequentist_Accumulator.
+        """
+        self.count += other.count
+        self.total += other.total
     
-    # Main loop
-    while not f.EOF:
-        f.Read()
-        raw = f.Get()
-        # Annotations
-        annotations = Build_String(raw[0], col_keep, delim)
-        # Core
-        data = Get_Data(raw, cols)
-        results = Pairwise_Analyses(data, test_type, directional)
-        total_score, total_tests, result_strs = results
-        # Output
-        for values in result_strs:
-            sb = delim.join(values)
-            sb += delim + annotations
-            Controlled_Output(sb, o)
-        # Metrics
-        count_total += total_score
-        count_tests += total_tests
-        count_exp += 1
-        count_grp += len(results)
-        count_line += len(data)
+    def Get_Summary(self):
+        """
+        Return everything needed to recreate the p-value, as a list:
+            [count, total]
+        """
+        return [self.count, self.total]
     
-    # Finish
-    if path_out: o.close()
-    f.Close()
+    def Add_Summary(self, summary):
+        """
+        Add all the permutation differences summarized by a list returned by
+        Get_Summary.
+        """
+        self.count += summary[0]
+        self.total += summary[1]
     
-    # Reporting
-    Report_Metrics([count_total, count_tests, count_exp, count_grp, count_line,
-            len(col_data)])
+    def Get_P_Value(self):
+        """
+        Return the p-value based on all the permutation differences added so
+        far.
+        """
+        return float(self.count)/self.total
     
-    # Wrap up
-    return 0
+    def Get_P_Value__Sampled(self, exceedances=None):
+        """
+        Return the p-value, assuming that the permutation differences added so
+        far were from randomly drawn relabellings. The original labelling is
+        counted as one more draw which is at least as large, (b + 1)/(m + 1),
+        so the p-value is never 0.
+        
+        If the differences were added by Add_Batch_Until, (Besag and
+        Clifford's sequential test) @exceedances is the number it was given.
+        If sampling stopped once @exceedances were reached, after L draws, the
+        p-value is h/L. Otherwise, all n draws were made, and it is
+        (g + 1)/n.
+        """
+        if exceedances == None:
+            return float(self.count + 1)/(self.total + 1)
+        if self.count >= exceedances:
+            return float(self.count)/self.total
+        return min(float(self.count + 1)/self.total, 1.0)
+    
+    def Get_Standard_Error(self, exceedances=None):
+        """
+        Return the standard error of the p-value returned by
+        Get_P_Value__Sampled.
+        """
+        p = self.Get_P_Value__Sampled(exceedances)
+        return ((p * (1 - p))/self.total) ** 0.5
 
-def Get_Data(nested_lists, indexes):
+class SDev_Accumulator:
     """
-    Take a table of data (@nested_lists) and return only the relevant columns as
-    specified by @indexes.
+    Calculates the p-value of a Standard Deviation test, by keeping a running
+    mean and sum of squared deviations of the permutation differences fed to it.
+    (Welford's algorithm) The differences themselves are not stored.
     
-    @nested_lists
-            (list<list<str>>)
-            The data table, stored as a list of lists. Each nested list
-            is one row of data.
-    @indexes
-            (list<int>)
-            For each "row" of data, these are the indexes for the columns which
-            contain the desired data.
-            The first index is the column number for the experiment IDs, the
-            second index is the column number for the group IDs, and the rest
-            are the indexes for the data values to be analyzed.
-    
-    Get_Data(list<list<str>>, list<int>) -> list<[str, str, float/None...]>
+    Differences can be added one at a time, or in batches. (Lists or NumPy
+    arrays) Batches are summarized first and then combined with the running
+    totals. (Chan's parallel algorithm) Accumulators which were fed different
+    differences for the same observed difference can be merged the same way.
     """
-    result = []
-    for sublist in nested_lists:
-        temp = []
-        temp.append(sublist[indexes[0]])
-        temp.append(sublist[indexes[1]])
-        for i in indexes[2:]:
-            value = sublist[i]
-            if value:
-                value = float(value)
-            else:
-                value = None
-            temp.append(value)
-        result.append(temp)
-    return result
+    def __init__(self, difference, directional):
+        """
+        @difference
+                (float)
+                The actual difference observed.
+        @directional
+                (bool)
+                Whether or not the tests should be directional or not.
+        """
+        self.difference = difference
+        self.directional = directional
+        self.total = 0
+        self.mean = 0.0
+        self.squares = 0.0
+    
+    def Add(self, permutation_dif):
+        """
+        Add one permutation difference.
+        """
+        self.total += 1
+        delta = permutation_dif - self.mean
+        self.mean += delta/self.total
+        self.squares += delta * (permutation_dif - self.mean)
+    
+    def Add_Batch(self, differences):
+        """
+        Add a list, or NumPy array, of permutation differences.
+        """
+        length = len(differences)
+        if not length: return
+        if type(differences) == list:
+            mean = sum(differences)/length
+            squares = 0.0
+            for i in differences:
+                squares += (i - mean) ** 2
+        else:
+            mean = float(differences.mean())
+            squares = float(((differences - mean) ** 2).sum())
+        self.Combine(length, mean, squares)
+    
+    def Merge(self, other):
+        """
+        Add all the permutation differences which were added to another
+        SDev_Accumulator.
+        """
+        if other.total:
+            self.Combine(other.total, other.mean, other.squares)
+    
+    def Get_Summary(self):
+        """
+        Return everything needed to recreate the standard deviation, as a list:
+            [total, mean, squares]
+        """
+        return [self.total, self.mean, self.squares]
+    
+    def Add_Summary(self, summary):
+        """
+        Add all the permutation differences summarized by a list returned by
+        Get_Summary.
+        """
+        if summary[0]:
+            self.Combine(summary[0], summary[1], summary[2])
+    
+    def Combine(self, total, mean, squares):
+        """
+        Combine the running totals with the summary of another set of
+        permutation differences.
+        """
+        if not self.total:
+            self.total = total
+            self.mean = mean
+            self.squares = squares
+            return
+        new_total = self.total + total
+        delta = mean - self.mean
+        self.mean += (delta * total)/new_total
+        self.squares += squares + ((delta ** 2) * self.total * total)/new_total
+        self.total = new_total
+    
+    def Get_P_Value(self):
+        """
+        Return the p-value based on all the permutation differences added so
+        far.
+        """
+        sd = (self.squares/self.total) ** 0.5
+        return Calculate_P_Value__SD(self.difference, sd, self.directional)
+    
+    def Get_Standard_Error(self):
+        """
+        Return the standard error of the p-value, assuming that the
+        permutation differences added so far were from randomly drawn
+        relabellings.
+        
+        The standard error of the estimated standard deviation is approximately
+        sd/((2 * (n - 1)) ** 0.5), which is converted into the standard error of
+        the p-value using the slope of the normal distribution at the z-score.
+        """
+        if self.total < 2: return float("inf")
+        sd = (self.squares/self.total) ** 0.5
+        z_score = self.difference/sd
+        density = math.exp(-(z_score ** 2)/2)/((2 * math.pi) ** 0.5)
+        error = (density * abs(z_score))/((2 * (self.total - 1)) ** 0.5)
+        if not self.directional:
+            error *= 2
+        return error
 
-def Pairwise_Analyses(data, test_type, directional):
+class Experiment_Reader:
     """
-    Perform the relevant pairwise analyses and return the metrics of the
-    resulting analysis and the strings to be output to the data file as a list
-    of lists.
+    Reads a table file one experiment at a time. The rows of an experiment are
+    the consecutive rows which share the same experiment ID.
     
-    @data
-            (list<list>)
-            A list of lists. Each sublist contains the data for one sample.
+    The file is read in large chunks, and each row is split into its values
+    once. Only the experiment IDs, group IDs, and data values of each row are
+    kept, and only the values to be kept as is of the first row of each
+    experiment.
+    """
+    def __init__(self, path, delim, cols, col_keep, header):
+        """
+        @path
+                (str)
+                The filepath of the input file.
+        @delim
+                (str)
+                The delimiter of the input file.
+        @cols
+                (list<int>)
+                The column numbers of the experiment IDs, the group IDs, and
+                the values to be analyzed.
+        @col_keep
+                (list<int>)
+                The column numbers of the values to be kept as is.
+        @header
+                (bool)
+                Whether or not the first row of the file is a header.
+        """
+        self.path = path
+        self.delim = delim
+        self.cols = cols
+        self.col_keep = col_keep
+        self.header = header
+        self.header_text = ""
+        self.file = None
+        self.offset = 0 # Position of the line most recently read
+        self.ends = collections.deque() # Position after each experiment read
+        self.skip = 0
+    
+    def Open(self):
+        """
+        Open the input file, and read the header, if there is one.
+        """
+        self.file = open(self.path, "rb")
+        if self.header:
+            self.header_text = Decode(self.file.readline())
+    
+    def Seek(self, position):
+        """
+        Skip to a position returned in self.ends, so that the experiments are
+        read from the experiment after the one that position was returned for.
+        
+        Every time an experiment is generated by Experiments, the position
+        after it is added to the end of self.ends.
+        """
+        self.file.seek(position)
+    
+    def Get_Header_Text(self):
+        """
+        Return the header row, as read from the file, or an empty string if
+        there is no header.
+        """
+        return self.header_text
+    
+    def Close(self):
+        """
+        Close the input file.
+        """
+        if self.file:
+            self.file.close()
+            self.file = None
+    
+    def Lines(self):
+        """
+        Generate the remaining lines of the file, without their line endings,
+        reading READ_CHUNK_SIZE bytes at a time. The byte offset of each line
+        is kept in self.offset while it is being processed, and the end of the
+        file once there are no more lines.
+        """
+        offset = self.file.tell()
+        leftover = b""
+        while True:
+            chunk = self.file.read(READ_CHUNK_SIZE)
+            if not chunk: break
+            lines = (leftover + chunk).split(b"\n")
+            leftover = lines.pop()
+            for line in lines:
+                self.offset = offset
+                offset += len(line) + 1
+                yield Decode(line).rstrip("\r")
+        if leftover:
+            self.offset = offset
+            offset += len(leftover)
+            yield Decode(leftover).rstrip("\r")
+        self.offset = offset
+    
+    def Experiments(self):
+        """
+        Generate the data and the annotations of each experiment, in the same
+        order as the experiments in the file.
+        
+        The data is a list of lists, one per row. The first value of each
+        sublist is the experiment ID, the second value is the group ID, and the
+        rest are the data values as floats. Missing values are None.
+        
+        The annotations are the values to be kept of the first row of the
+        experiment, joined by the delimiter.
+        
+        Experiments() -> generator<[list<list>, str]>
+        """
+        delim = self.delim
+        col_exp = self.cols[0]
+        col_grp = self.cols[1]
+        col_data = self.cols[2:]
+        data = []
+        annotations = ""
+        current = None
+        for line in self.Lines():
+            if not line: continue
+            values = line.split(delim)
+            exp_ID = values[col_exp]
+            if exp_ID != current:
+                if data:
+                    self.ends.append(self.offset)
+                    yield [data, annotations]
+                data = []
+                annotations = Build_String(values, self.col_keep, delim)
+                current = exp_ID
+            row = [exp_ID, values[col_grp]]
+            row += [float(values[i]) if values[i] else None for i in col_data]
+            data.append(row)
+        if data:
+            self.ends.append(self.offset)
+            yield [data, annotations]
+
+class Indexed_Experiment_Reader(Experiment_Reader):
+    """
+    Same as Experiment_Reader, except that the rows of an experiment do not
+    need to be consecutive.
+    
+    The file is read once to build an index of the byte offsets of each run of
+    consecutive rows which share the same experiment ID. The rows of each
+    experiment are then read together, run by run, by seeking to them. The
+    experiments are read in the order in which they first appear in the file,
+    or in a chosen order, which also allows only some of them to be read.
+    
+    The index can be saved to an index file, and is loaded from it instead of
+    being built again if the input file has not changed since.
+    """
+    def __init__(self, path, delim, cols, col_keep, header, index_path=None,
+                experiment_IDs=None):
+        """
+        @path
+                (str)
+                The filepath of the input file.
+        @delim
+                (str)
+                The delimiter of the input file.
+        @cols
+                (list<int>)
+                The column numbers of the experiment IDs, the group IDs, and
+                the values to be analyzed.
+        @col_keep
+                (list<int>)
+                The column numbers of the values to be kept as is.
+        @header
+                (bool)
+                Whether or not the first row of the file is a header.
+        @index_path
+                (str) OR
+                (None)
+                The filepath of the index file. If None, the index is not
+                saved.
+        @experiment_IDs
+                (list<str>) OR
+                (None)
+                The experiments to be read, in order. If None, all of them are
+                read, in the order in which they first appear in the file.
+        """
+        Experiment_Reader.__init__(self, path, delim, cols, col_keep, header)
+        self.index_path = index_path
+        self.experiment_IDs = experiment_IDs
+        self.start = 0 # Offset of the first row after the header
+        self.order = [] # Experiment IDs, in order of first appearance
+        self.runs = {} # Experiment ID : [[start, end], [start, end]...]
+    
+    def Open(self):
+        """
+        Open the input file, read the header, if there is one, and load or
+        build the index.
+        """
+        self.file = open(self.path, "rb")
+        if self.header:
+            self.header_text = Decode(self.file.readline())
+        self.start = self.file.tell()
+        self.file.seek(self.start)
+        if not self.Load_Index():
+            self.Build_Index()
+            self.Save_Index()
+        if self.experiment_IDs != None:
+            for exp_ID in self.experiment_IDs:
+                if exp_ID not in self.runs:
+                    PRINT.printE(STR__experiment_missing.format(s = exp_ID))
+    
+    def Get_Signature(self):
+        """
+        Return the details of the input file and of how it is read, which must
+        be the same for a saved index to be used.
+        """
+        return [os.path.getsize(self.path), os.path.getmtime(self.path),
+                self.delim, self.cols[0], self.start]
+    
+    def Build_Index(self):
+        """
+        Read through the input file and record the byte offsets of each run of
+        consecutive rows which share the same experiment ID.
+        """
+        delim = self.delim
+        col_exp = self.cols[0]
+        order = []
+        runs = {}
+        current = None
+        offset = self.start
+        self.file.seek(offset)
+        for line in self.file:
+            end = offset + len(line)
+            text = Decode(line).rstrip("\r\n")
+            if text:
+                exp_ID = text.split(delim)[col_exp]
+                if exp_ID == current:
+                    runs[exp_ID][-1][1] = end
+                elif exp_ID in runs:
+                    runs[exp_ID].append([offset, end])
+                else:
+                    runs[exp_ID] = [[offset, end]]
+                    order.append(exp_ID)
+                current = exp_ID
+            offset = end
+        self.order = order
+        self.runs = runs
+    
+    def Load_Index(self):
+        """
+        Load the index from the index file, if there is one and it matches the
+        input file. Return True if the index was loaded, and False otherwise.
+        """
+        if not (self.index_path and os.path.exists(self.index_path)):
+            return False
+        try:
+            f = open(self.index_path, "rb")
+            signature, order, runs = pickle.load(f)
+            f.close()
+        except:
+            PRINT.printE(STR__index_read.format(f = self.index_path))
+            return False
+        if signature != self.Get_Signature(): return False
+        self.order = order
+        self.runs = runs
+        return True
+    
+    def Save_Index(self):
+        """
+        Save the index into the index file, if there is one.
+        """
+        if not self.index_path: return
+        try:
+            f = open(self.index_path, "wb")
+            pickle.dump([self.Get_Signature(), self.order, self.runs], f, 2)
+            f.close()
+        except:
+            PRINT.printE(STR__index_write.format(f = self.index_path))
+    
+    def Seek(self, position):
+        """
+        Skip the first @position experiments to be read.
+        """
+        self.skip = position
+    
+    def Lines(self):
+        """
+        Generate the lines of each experiment to be read, without their line
+        endings, with the lines of each experiment together. The number of
+        experiments before the one whose lines are being generated is kept in
+        self.offset, and the number of experiments once there are no more
+        lines.
+        """
+        if self.experiment_IDs == None: order = self.order
+        else: order = self.experiment_IDs
+        for i in range(self.skip, len(order)):
+            exp_ID = order[i]
+            self.offset = i
+            for start, end in self.runs.get(exp_ID, []):
+                self.file.seek(start)
+                text = Decode(self.file.read(end - start))
+                for line in text.split("\n"):
+                    yield line.rstrip("\r")
+        self.offset = len(order)
+
+class Columnar_Experiment_Reader(Experiment_Reader):
+    """
+    Same as Experiment_Reader, except that the experiments are read from a
+    columnar cache of the input file, which is built from the input file the
+    first time, and again whenever the input file changes.
+    
+    The cache is a folder of NumPy files: an array of values and an array of
+    missing value flags for every column of numbers in the input file, and an
+    array of group ID codes. A metadata file holds the group IDs, the
+    experiment IDs, the row at which each experiment starts, and the first row
+    of each experiment. The arrays are memory-mapped, so only the rows of the
+    experiment being analyzed are read, and no values are converted from text.
+    """
+    def __init__(self, folder, path, delim, cols, col_keep, header,
+                unsorted=False, index_path=None, experiment_IDs=None):
+        """
+        @folder
+                (str)
+                The filepath of the cache folder.
+        @path
+                (str)
+                The filepath of the input file.
+        @delim
+                (str)
+                The delimiter of the input file.
+        @cols
+                (list<int>)
+                The column numbers of the experiment IDs, the group IDs, and
+                the values to be analyzed.
+        @col_keep
+                (list<int>)
+                The column numbers of the values to be kept as is.
+        @header
+                (bool)
+                Whether or not the first row of the file is a header.
+        @unsorted
+                (bool)
+                Whether or not the rows of an experiment can be spread out
+                across the input file.
+        @index_path
+                (str) OR
+                (None)
+                The filepath of the index file of an unsorted input file.
+        @experiment_IDs
+                (list<str>) OR
+                (None)
+                The experiments to be read, in order. If None, all of them are
+                read.
+        """
+        Experiment_Reader.__init__(self, path, delim, cols, col_keep, header)
+        self.folder = folder
+        self.unsorted = unsorted
+        self.index_path = index_path
+        self.experiment_IDs = experiment_IDs
+        self.group_IDs = []
+        self.exp_IDs = []
+        self.starts = [0]
+        self.first_rows = []
+        self.groups = None
+        self.columns = {}
+        self.missing = {}
+    
+    def Open(self):
+        """
+        Open the cache, building it first if there is no valid cache.
+        """
+        if not self.Load():
+            self.Build()
+            self.Load()
+    
+    def Seek(self, position):
+        """
+        Skip the first @position experiments to be read.
+        """
+        self.skip = position
+    
+    def Close(self):
+        """
+        Release the memory-mapped arrays.
+        """
+        self.groups = None
+        self.columns = {}
+        self.missing = {}
+    
+    def Get_Signature(self):
+        """
+        Return the details of the input file and of how it is read, which must
+        be the same for the cache to be used.
+        """
+        return [os.path.getsize(self.path), os.path.getmtime(self.path),
+                self.delim, self.cols[0], self.cols[1], self.header,
+                self.unsorted]
+    
+    def Get_File_Path(self, name):
+        """
+        Return the filepath of a file in the cache folder.
+        """
+        return os.path.join(self.folder, name)
+    
+    def Load(self):
+        """
+        Open the cache, if there is one and it matches the input file. Return
+        True if the cache was opened, and False otherwise.
+        """
+        meta_path = self.Get_File_Path(STR__file_meta)
+        if not os.path.exists(meta_path): return False
+        try:
+            f = open(meta_path, "rb")
+            meta = pickle.load(f)
+            f.close()
+        except:
+            PRINT.printE(STR__columnar_stale.format(f = self.folder))
+            return False
+        signature, path, header_text, numeric = meta[:4]
+        if signature != self.Get_Signature(): return False
+        for i in self.cols[2:]:
+            if i >= len(numeric) or not numeric[i]:
+                raise ValueError(STR__columnar_column.format(n = i + 1))
+        self.header_text = header_text
+        self.group_IDs, self.exp_IDs, self.starts, self.first_rows = meta[4:]
+        self.groups = numpy.load(self.Get_File_Path(STR__file_groups),
+                mmap_mode = "r")
+        for i in self.cols[2:]:
+            self.columns[i] = numpy.load(self.Get_File_Path(
+                    STR__file_column.format(n = i)), mmap_mode = "r")
+            self.missing[i] = numpy.load(self.Get_File_Path(
+                    STR__file_missing.format(n = i)), mmap_mode = "r")
+        return True
+    
+    def Build(self):
+        """
+        Read through the input file, and write the cache.
+        """
+        delim = self.delim
+        col_exp = self.cols[0]
+        col_grp = self.cols[1]
+        if self.unsorted:
+            reader = Indexed_Experiment_Reader(self.path, delim, self.cols, [],
+                    self.header, self.index_path)
+        else:
+            reader = Experiment_Reader(self.path, delim, self.cols, [],
+                    self.header)
+        reader.Open()
+        # Columns
+        numeric = [] # Whether each column only contains numbers
+        numbers = []
+        missing = []
+        # Rows
+        codes = {}
+        group_IDs = []
+        groups = array.array("i")
+        exp_IDs = []
+        starts = []
+        first_rows = []
+        current = None
+        rows = 0
+        for line in reader.Lines():
+            if not line: continue
+            values = line.split(delim)
+            while len(numeric) < len(values):
+                numeric.append(True)
+                numbers.append(array.array("d", [0.0] * rows))
+                missing.append(array.array("b", [1] * rows))
+            exp_ID = values[col_exp]
+            if exp_ID != current:
+                exp_IDs.append(exp_ID)
+                starts.append(rows)
+                first_rows.append(values)
+                current = exp_ID
+            group_ID = values[col_grp]
+            if group_ID not in codes:
+                codes[group_ID] = len(group_IDs)
+                group_IDs.append(group_ID)
+            groups.append(codes[group_ID])
+            for i in range(len(numeric)):
+                if not numeric[i]: continue
+                if i < len(values) and values[i]:
+                    try:
+                        number = float(values[i])
+                    except ValueError:
+                        numeric[i] = False
+                        numbers[i] = None
+                        missing[i] = None
+                        continue
+                    numbers[i].append(number)
+                    missing[i].append(0)
+                else:
+                    numbers[i].append(0.0)
+                    missing[i].append(1)
+            rows += 1
+        starts.append(rows)
+        header_text = reader.Get_Header_Text()
+        reader.Close()
+        # Write
+        if not os.path.isdir(self.folder):
+            os.makedirs(self.folder)
+        meta_path = self.Get_File_Path(STR__file_meta)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        numpy.save(self.Get_File_Path(STR__file_groups),
+                numpy.array(groups, dtype = numpy.int32))
+        for i in range(len(numeric)):
+            if not numeric[i]: continue
+            numpy.save(self.Get_File_Path(STR__file_column.format(n = i)),
+                    numpy.array(numbers[i], dtype = numpy.float64))
+            numpy.save(self.Get_File_Path(STR__file_missing.format(n = i)),
+                    numpy.array(missing[i], dtype = numpy.bool_))
+        meta = [self.Get_Signature(), self.path, header_text, numeric,
+                group_IDs, exp_IDs, starts, first_rows]
+        f = open(meta_path, "wb")
+        pickle.dump(meta, f, 2)
+        f.close()
+    
+    def Experiments(self):
+        """
+        Generate the data and the annotations of each experiment, in the same
+        format as Experiment_Reader.Experiments.
+        
+        Experiments() -> generator<[list<list>, str]>
+        """
+        if self.experiment_IDs == None:
+            indexes = range(len(self.exp_IDs))
+        else:
+            positions = {}
+            for i in range(len(self.exp_IDs)):
+                positions.setdefault(self.exp_IDs[i], i)
+            indexes = []
+            for exp_ID in self.experiment_IDs:
+                if exp_ID in positions:
+                    indexes.append(positions[exp_ID])
+                else:
+                    PRINT.printE(STR__experiment_missing.format(s = exp_ID))
+        indexes = indexes[self.skip:]
+        position = self.skip
+        for window in self.Windows(indexes):
+            start = self.starts[window[0]]
+            rows = self.Get_Rows(start, self.starts[window[-1] + 1])
+            for i in window:
+                exp_ID = self.exp_IDs[i]
+                data = []
+                for row in rows[self.starts[i] - start:self.starts[i + 1] -
+                        start]:
+                    data.append([exp_ID] + row)
+                annotations = Build_String(self.first_rows[i], self.col_keep,
+                        self.delim)
+                position += 1
+                self.ends.append(position)
+                yield [data, annotations]
+    
+    def Windows(self, indexes):
+        """
+        Split up the indexes of the experiments to be read into lists of
+        consecutive indexes, which together have no more than COLUMNAR_WINDOW
+        rows, unless a single experiment has more rows than that.
+        """
+        window = []
+        rows = 0
+        for i in indexes:
+            length = self.starts[i + 1] - self.starts[i]
+            if window and (i != window[-1] + 1 or rows + length >
+                    COLUMNAR_WINDOW):
+                yield window
+                window = []
+                rows = 0
+            window.append(i)
+            rows += length
+        if window: yield window
+    
+    def Get_Rows(self, start, end):
+        """
+        Return the group IDs and the data values of the rows from @start to
+        (@end - 1), as a list of lists. Missing values are None.
+        """
+        codes = self.groups[start:end].tolist()
+        group_IDs = [self.group_IDs[code] for code in codes]
+        columns = []
+        for col in self.cols[2:]:
+            values = self.columns[col][start:end].tolist()
+            flags = self.missing[col][start:end]
+            for j in numpy.flatnonzero(flags).tolist():
+                values[j] = None
+            columns.append(values)
+        rows = []
+        for group_ID, values in zip(group_IDs, zip(*columns)):
+            rows.append([group_ID] + list(values))
+        return rows
+
+def Get_Columnar_Source(folder):
+    """
+    Return the filepath of the input file which the columnar cache in @folder
+    was built from, or an empty string if the cache cannot be read.
+    
+    @folder
+            (str)
+            The filepath of the cache folder.
+    
+    Get_Columnar_Source(str) -> str
+    """
+    try:
+        f = open(os.path.join(folder, STR__file_meta), "rb")
+        meta = pickle.load(f)
+        f.close()
+    except:
+        return ""
+    return meta[1]
+
+class Binary_Results_Writer:
+    """
+    Writes the results to a file in a compact binary format, one fixed size
+    record per row of results. The experiment IDs and group IDs are replaced by
+    indexes into tables, which are written at the end of the file, along with
+    the extra information of each experiment and the header row.
+    
+    Records of up to one experiment are packed and written at once.
+    """
+    def __init__(self, path, columns, width, delim, state=None):
+        """
+        @path
+                (str)
+                The filepath of the output file.
+        @columns
+                (int)
+                The number of data columns.
+        @width
+                (int)
+                The number of values in each result. (2 or 5)
+        @delim
+                (str)
+                The delimiter to be used when the file is converted to text.
+        @state
+                (list) OR
+                (None)
+                The state returned by Get_State, if an interrupted file is to be
+                continued. If None, a new file is started.
+        """
+        self.width = width
+        self.delim = delim
+        self.record = Get_Binary_Record(columns, width)
+        self.header = None
+        self.exp_IDs = []
+        self.annotations = []
+        self.codes = {}
+        self.group_IDs = []
+        self.large = {} # [Record, Column] : Relabellings evaluated, if >= 2^64
+        self.records = 0
+        if state:
+            self.file = Reopen_File(path, "r+b", state[0])
+            self.header, self.exp_IDs, self.annotations = state[1:4]
+            self.group_IDs, self.large, self.records = state[4:]
+            for i in range(len(self.group_IDs)):
+                self.codes[self.group_IDs[i]] = i
+        else:
+            self.file = open(path, "wb", OUTPUT_BUFFER_SIZE)
+            self.file.write(struct.pack("<4sBBI", STR__binary_magic,
+                    BINARY_VERSION, width, columns))
+    
+    def Get_State(self):
+        """
+        Write everything written so far to disk, and return everything needed
+        to continue the file later, as a list:
+            [offset, header, exp_IDs, annotations, group_IDs, large, records]
+        """
+        offset = Sync_File(self.file)
+        return [offset, self.header, list(self.exp_IDs),
+                list(self.annotations), list(self.group_IDs), dict(self.large),
+                self.records]
+    
+    def Set_Header(self, header):
+        """
+        Set the header row to be written when the file is converted to text.
+        """
+        self.header = header
+    
+    def Get_Code(self, group_ID):
+        """
+        Return the index of a group ID in the table of group IDs.
+        """
+        if group_ID not in self.codes:
+            self.codes[group_ID] = len(self.group_IDs)
+            self.group_IDs.append(group_ID)
+        return self.codes[group_ID]
+    
+    def Write_Experiment(self, rows, annotations):
+        """
+        Write the rows of results of an experiment, as returned by
+        Pairwise_Analyses.
+        """
+        if not rows: return
+        exp_index = len(self.exp_IDs)
+        self.exp_IDs.append(rows[0][0])
+        self.annotations.append(annotations)
+        width = self.width
+        records = []
+        for row in rows:
+            g1 = row[1]
+            fields = [exp_index, self.Get_Code(g1), self.Get_Code(row[2])]
+            for i in range(3, len(row), width):
+                p_value = row[i]
+                larger = row[i + width - 1]
+                if p_value == None: fields.append(float("nan"))
+                else: fields.append(p_value)
+                if width == 5:
+                    error, method, evaluated = row[i + 1:i + 4]
+                    if error == None: fields.append(float("nan"))
+                    else: fields.append(error)
+                    fields.append(method or 0)
+                    if evaluated >= 2 ** 64 - 1:
+                        self.large[(self.records, (i - 3)//width)] = evaluated
+                        evaluated = 2 ** 64 - 1
+                    fields.append(evaluated)
+                if larger == None: fields.append(0)
+                elif larger == g1: fields.append(1)
+                else: fields.append(2)
+            records.append(self.record.pack(*fields))
+            self.records += 1
+        self.file.write(b"".join(records))
+    
+    def Close(self):
+        """
+        Write the footer and close the file.
+        """
+        position = self.file.tell()
+        footer = [self.delim, self.header, self.exp_IDs, self.group_IDs,
+                self.annotations, self.large]
+        pickle.dump(footer, self.file, 2)
+        self.file.write(struct.pack("<Q", position))
+        self.file.close()
+
+class Lazy_Pool:
+    """
+    A pool of worker processes which is only started the first time it is
+    used, so that runs in which no work is ever given to it do not start any
+    worker processes.
+    """
+    def __init__(self, processes):
+        """
+        @processes
+                (int)
+                The number of worker processes.
+        """
+        self.processes = processes
+        self.pool = None
+    
+    def imap(self, function, arguments):
+        """
+        Same as multiprocessing.Pool.imap, starting the worker processes first
+        if they have not been started yet.
+        """
+        if not self.pool:
+            self.pool = multiprocessing.Pool(self.processes)
+        return self.pool.imap(function, arguments)
+    
+    def Close(self):
+        """
+        Stop the worker processes, if they were started.
+        """
+        if self.pool:
+            self.pool.close()
+            self.pool.join()
+
+class Threaded_Writer:
+    """
+    Writes strings to an output file, or prints them if there is no output
+    file, from a separate thread, so that the thread producing the strings does
+    not have to wait for the file system.
+    
+    Up to a set number of strings can be waiting to be written. All the strings
+    waiting at the time are written at once.
+    """
+    def __init__(self, output_file, depth):
+        """
+        @output_file
+                (file) OR
+                (None)
+                The output file to which the strings are to be written, or
+                None.
+        @depth
+                (int)
+                The greatest number of strings which can be waiting to be
+                written.
+        """
+        self.output_file = output_file
+        self.waiting = queue.Queue(depth)
+        self.error = None
+        self.thread = threading.Thread(target = self.Run)
+        self.thread.daemon = True
+        self.thread.start()
+    
+    def Write(self, string):
+        """
+        Queue up a string to be written, as a line of its own.
+        """
+        if self.error: raise self.error
+        self.waiting.put(string)
+    
+    def Flush(self):
+        """
+        Wait for all the queued strings to be written.
+        """
+        self.waiting.join()
+        if self.error: raise self.error
+    
+    def Close(self):
+        """
+        Wait for all the queued strings to be written, and stop the thread.
+        """
+        self.waiting.put(None)
+        self.thread.join()
+        if self.error: raise self.error
+    
+    def Run(self):
+        """
+        Write the queued strings until told to stop. (Run by the thread)
+        """
+        finished = False
+        while not finished:
+            strings = [self.waiting.get()]
+            while True:
+                try:
+                    strings.append(self.waiting.get_nowait())
+                except queue.Empty:
+                    break
+            taken = len(strings)
+            if strings[-1] == None:
+                strings.pop()
+                finished = True
+            if strings and not self.error:
+                try:
+                    Controlled_Output("\n".join(strings), self.output_file)
+                except Exception as error:
+                    self.error = error
+            for i in range(taken):
+                self.waiting.task_done()
+
+class Null_Cache:
+    """
+    Keeps the summaries of the permutation differences of previous
+    comparisons, so that comparisons with the same null distribution are only
+    calculated once.
+    
+    When more than @capacity summaries are kept, the least recently used
+    summary is discarded. The summaries can be loaded from and saved to a
+    file, so that they can be reused between runs.
+    """
+    def __init__(self, capacity, path=None):
+        """
+        @capacity
+                (int)
+                The number of summaries to keep.
+        @path
+                (str - filepath) OR
+                (None)
+                The filepath of the file the summaries are loaded from and
+                saved to. If None, the summaries are only kept in memory.
+        """
+        self.capacity = capacity
+        self.path = path
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.added = None # Keys stored since Take_Added, if tracked
+        if path and os.path.exists(path):
+            self.Load()
+    
+    def Get(self, key):
+        """
+        Return the summary stored under @key, or None if there is none.
+        """
+        if key in self.entries:
+            summary = self.entries.pop(key)
+            self.entries[key] = summary # Most recently used
+            self.hits += 1
+            return summary
+        self.misses += 1
+        return None
+    
+    def Put(self, key, summary):
+        """
+        Store a summary under @key, discarding the least recently used
+        summaries if there are too many.
+        """
+        if key in self.entries:
+            self.entries.pop(key)
+        self.entries[key] = summary
+        if self.added != None:
+            self.added.append(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last = False)
+    
+    def Take_Added(self):
+        """
+        Return the summaries stored since the last call, as a list of
+        [key, summary] pairs, and keep track of the summaries stored from now
+        on.
+        """
+        added = []
+        if self.added:
+            for key in self.added:
+                if key in self.entries:
+                    added.append([key, self.entries[key]])
+        self.added = []
+        return added
+    
+    def Load(self):
+        """
+        Add the summaries saved in the cache file.
+        """
+        try:
+            f = open(self.path, "rb")
+            entries = pickle.load(f)
+            f.close()
+        except:
+            PRINT.printE(STR__cache_read.format(f = self.path))
+            return
+        for key, summary in entries:
+            self.Put(key, summary)
+    
+    def Save(self):
+        """
+        Save the summaries into the cache file, if there is one.
+        """
+        if not self.path: return
+        try:
+            f = open(self.path, "wb")
+            pickle.dump(list(self.entries.items()), f, 2)
+            f.close()
+        except:
+            PRINT.printE(STR__cache_write.format(f = self.path))
+
+class Results_Store:
+    """
+    Keeps the results of the pairwise analyses of every experiment, under a
+    hash of the data of the experiment and of the settings which affect the
+    results, so that experiments which are unchanged since a previous run do
+    not need to be analyzed again.
+    
+    The results are loaded from and saved to a file. Only the results which
+    were stored or used during this run are saved, so results for experiments
+    which have since changed or been removed are discarded.
+    """
+    def __init__(self, path, parameters):
+        """
+        @path
+                (str - filepath)
+                The filepath of the file the results are loaded from and saved
+                to.
+        @parameters
+                (list)
+                Everything other than the data which affects the results of the
+                pairwise analyses.
+        """
+        self.path = path
+        self.parameters = parameters
+        self.entries = {}
+        self.kept = {}
+        self.hits = 0
+        if os.path.exists(path):
+            self.Load()
+    
+    def Get_Key(self, data):
+        """
+        Return the hash of the data of an experiment, as generated by
+        Experiment_Reader.Experiments, and of the settings.
+        """
+        text = repr([self.parameters, data])
+        if type(text) != bytes: text = text.encode("utf-8")
+        return hashlib.sha1(text).hexdigest()
+    
+    def Get(self, key):
+        """
+        Return the results stored under @key, or None if there are none.
+        """
+        results = self.entries.get(key)
+        if results != None:
+            self.kept[key] = results
+            self.hits += 1
+        return results
+    
+    def Put(self, key, results):
+        """
+        Store the results of an experiment under @key.
+        """
+        self.entries[key] = results
+        self.kept[key] = results
+    
+    def Load(self):
+        """
+        Add the results saved in the store file.
+        """
+        try:
+            f = open(self.path, "rb")
+            self.entries = pickle.load(f)
+            f.close()
+        except:
+            PRINT.printE(STR__store_read.format(f = self.path))
+            self.entries = {}
+    
+    def Save(self):
+        """
+        Save the results stored or used during this run into the store file.
+        """
+        try:
+            path_temp = self.path + STR__temp_suffix
+            f = open(path_temp, "wb")
+            pickle.dump(self.kept, f, 2)
+            f.close()
+            Replace_File(path_temp, self.path)
+        except:
+            PRINT.printE(STR__store_write.format(f = self.path))
+
+
+
+# Functions ####################################################################
+
+def Exhaustive_Pairwise_Permutation_Test(path_in, delim, col_exp, col_grp,
+            col_data, path_out, test_type, directional, header, keep,
+            col_keep, engine=DEFAULT__engine, block_size=DEFAULT__block_size,
+            draws=DEFAULT__draws, budget=DEFAULT__budget, seed=DEFAULT__seed,
+            exceedances=DEFAULT__exceedances, resolutions=DEFAULT__resolutions,
+            cache_size=DEFAULT__cache_size, cache_path=DEFAULT__cache_path,
+            processes=DEFAULT__processes, workers=DEFAULT__workers,
+            queue_depth=DEFAULT__queue_depth, unsorted=DEFAULT__unsorted,
+            index_path=DEFAULT__index_path,
+            experiment_IDs=DEFAULT__experiment_IDs,
+            columnar_path=DEFAULT__columnar_path, binary=DEFAULT__binary,
+            resume=DEFAULT__resume, store_path=DEFAULT__store_path,
+            shard=DEFAULT__shard):
+    """
+    For each experiment, perform pairwise tests between the experimental groups.
+    
+    @path_in
+            (str - filepath)
+            The filepath of the input file.
+    @delim
+            (str)
+            The delimiter to be used for the left table file. File formats and
+            their corresponding delimiters are as follows:
+                TSV - "\t" (tab character)
+                CSV - ","  (comma character)
+                SSV - " "  (whitespace character)
+    @col_exp
+            (int)
+            The column number for the column containing the experiment IDs.
+            (Uses a 0-index system.)
+    @col_grp
+            (int)
+            The column number for the column containing the group IDs.
+            (Uses a 0-index system.)
+    @col_data
+            (list<int>)
+            A list of the column numbers for the columns which contain the
+            values to be analyzed.
+            (Uses a 0-index system.)
+    @path_out
+            (str - filepath) OR
+            (None)
+            The filepath of the file where the output will be written into.
+    @test_type
+            (int - ENUM)
+            An integer denoting what kind of test will be performed on the data.
+            The options are as follows:
+                1 - Frequentist
+                2 - Standard Deviation
+                3 - Rank Sum
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    @header
+            (bool)
+            Whether or not there are headers in the input files.
+    @keep
+            (bool)
+            Whether or not to keep the headers, if they are present.
+    @col_keep
+            (list<int>)
+            A list of the column numbers for the columns which contain the
+            values to be kept as is. Note that only the values from the first
+            row of data from each experiment will be kept.
+            (Uses a 0-index system.)
+    @engine
+            (int - ENUM)
+            An integer denoting how the possible relabellings of the groups are
+            to be generated. The options are as follows:
+                1 - Permutator
+                2 - Combinations
+                3 - Analytic (Standard Deviation tests only)
+                4 - NumPy
+                5 - Gray Code
+                6 - Dynamic Programming (Frequentist tests only)
+                7 - Meet in the Middle (Frequentist tests only)
+                8 - Edgeworth (Frequentist tests only)
+    @block_size
+            (int)
+            The number of relabellings to be evaluated at once.
+    @draws
+            (int)
+            The number of random relabellings to evaluate for comparisons which
+            have more possible relabellings than @budget.
+    @budget
+            (int) OR
+            (None)
+            The largest number of possible relabellings which will all be
+            evaluated. If None, all possible relabellings are always evaluated.
+            If both this and @exceedances are None, the output will not contain
+            the extra columns describing how each p-value was obtained.
+    @seed
+            (int)
+            The seed for the random number generator.
+    @exceedances
+            (int) OR
+            (None)
+            The number of extreme random relabellings at which sampling stops,
+            for Frequentist tests with too many possible relabellings. If None,
+            sampling never stops early.
+    @resolutions
+            (list<float>) OR
+            (None)
+            The resolution of each column of data, for the Dynamic Programming
+            engine. If None, the resolutions are detected.
+    @cache_size
+            (int)
+            The number of exact results to keep, so that comparisons with the
+            same null distribution are only calculated once.
+    @cache_path
+            (str - filepath) OR
+            (None)
+            The filepath of the file the cached results are loaded from and
+            saved to. If None, the cached results are only kept in memory.
+    @processes
+            (int)
+            The number of processes to use. If more than 1, the experiments are
+            analyzed in parallel by worker processes.
+    @workers
+            (int)
+            The number of worker processes to use within each comparison. If
+            more than 1, the relabellings of large comparisons are split into
+            ranges which are evaluated in parallel.
+    @queue_depth
+            (int) OR
+            (None)
+            If not None, the input file is read and the output file is written
+            by separate threads, and this is the greatest number of experiments
+            read ahead, and of experiments with results waiting to be written.
+    @unsorted
+            (bool)
+            Whether or not the rows of an experiment can be spread out across
+            the input file. If so, the input file is indexed first.
+    @index_path
+            (str) OR
+            (None)
+            The filepath of the file in which the index of the input file is
+            kept. If None, the index is not saved. Implies @unsorted.
+    @experiment_IDs
+            (list<str>) OR
+            (None)
+            The experiments to be analyzed, in order. If None, all experiments
+            are analyzed. Implies @unsorted.
+    @columnar_path
+            (str) OR
+            (None)
+            The filepath of the folder of the columnar cache of the input file.
+            If None, the input file is read directly.
+    @binary
+            (bool)
+            Whether or not the results are written in the compact binary
+            format instead of as a TSV. Requires an output file.
+    @resume
+            (bool)
+            Whether or not to continue an interrupted run from where its
+            journal file says it was up to. If there is an output file, a
+            journal file is always kept while running.
+    @store_path
+            (str - filepath) OR
+            (None)
+            The filepath of the file in which the results of each experiment
+            are kept between runs, so that unchanged experiments are not
+            analyzed again. If None, every experiment is analyzed.
+    @shard
+            (list<int>) OR
+            (None)
+            The shard number, (From 1) and the number of shards, if only the
+            experiments belonging to one shard are to be analyzed. If None,
+            every experiment is analyzed.
+    
+    Exhaustive_Pairwise_Permutation_Test(path_in, delim, col_exp, col_grp,
+            col_data, output_file, test_type, header, keep, col_keep, engine,
+            block_size, draws, budget, seed, exceedances, resolutions,
+            cache_size, cache_path, processes, workers, queue_depth, unsorted,
+            index_path, experiment_IDs, columnar_path, binary, resume,
+            store_path, shard)
+    """
+    PRINT.printP(STR__report_begin)
+    
+    # Setup - Metrics
+    count_total = 0
+    count_tests = 0
+    count_planned = 0
+    count_exp = 0
+    count_grp = 0
+    count_line = 0
+    count_reused = 0
+    kept = [] # The position of each experiment in the shard, among them all
+    counts = [] # The number of rows output for each experiment in the shard
+    
+    # Setup - Journal
+    cols = [col_exp] + [col_grp] + col_data
+    if path_out: journal_path = path_out + STR__journal_suffix
+    else: journal_path = None
+    signature = [os.path.abspath(path_in), os.path.getsize(path_in),
+            os.path.getmtime(path_in), delim, cols, col_keep, header, keep,
+            test_type, directional, engine, block_size, draws, budget, seed,
+            exceedances, resolutions, bool(unsorted or index_path or
+            experiment_IDs), experiment_IDs, binary, shard]
+    journal = None
+    if resume and not os.path.exists(journal_path):
+        PRINT.printE(STR__journal_missing.format(f = journal_path))
+    elif resume:
+        journal = Load_Pickle(journal_path)
+        if not (journal and journal[0] == signature and
+                os.path.exists(path_out)):
+            PRINT.printE(STR__journal_invalid.format(f = journal_path))
+            return 1
+        position, offset, metrics, entries, hits, misses, state = journal[1:8]
+        kept, counts = journal[8]
+        stored = journal[9]
+        count_total, count_tests, count_planned = metrics[:3]
+        count_exp, count_grp, count_line, count_reused = metrics[3:]
+    
+    # Setup - File I/O
+    if columnar_path:
+        f = Columnar_Experiment_Reader(columnar_path, path_in, delim, cols,
+                col_keep, header, bool(unsorted or index_path or
+                experiment_IDs), index_path, experiment_IDs)
+    elif unsorted or index_path or experiment_IDs:
+        f = Indexed_Experiment_Reader(path_in, delim, cols, col_keep, header,
+                index_path, experiment_IDs)
+    else:
+        f = Experiment_Reader(path_in, delim, cols, col_keep, header)
+    try:
+        f.Open()
+    except ValueError as error: # Non-numeric data in the columnar cache
+        PRINT.printE(str(error))
+        return 1
+    if journal: f.Seek(position)
+    if budget == None and exceedances == None and (engine !=
+            ENGINE.EDGEWORTH): width = 2
+    else: width = 5
+    if binary and journal:
+        o = Binary_Results_Writer(path_out, len(col_data), width, delim, state)
+    elif binary:
+        o = Binary_Results_Writer(path_out, len(col_data), width, delim)
+    elif journal: o = Reopen_File(path_out, "r+", offset)
+    elif path_out: o = open(path_out, "w", OUTPUT_BUFFER_SIZE)
+    else: o = None
+    
+    # Setup - Others
+    cache = Null_Cache(cache_size, cache_path)
+    if journal:
+        for key, summary in entries:
+            cache.Put(key, summary)
+        cache.hits = hits
+        cache.misses = misses
+    if workers > 1: pool = Lazy_Pool(workers)
+    else: pool = None
+    settings = [test_type, directional, engine, block_size, draws, budget,
+            seed, exceedances, resolutions]
+    if store_path: store = Results_Store(store_path, [cols, settings])
+    else: store = None
+    if store and journal and stored:
+        kept_results, store.hits = stored
+        for key, results in kept_results:
+            store.Put(key, results)
+    
+    # Header
+    if header and keep and not journal:
+        # Process string
+        header_str = f.Get_Header_Text()
+        headers = header_str.split(delim)
+        headers[-1] = headers[-1][:-1]
+        # Build
+        sb = Build_Header_String(headers, col_exp, col_grp, col_data, col_keep,
+                delim, width)
+        # Write
+        if binary: o.Set_Header(sb)
+        else: Controlled_Output(sb, o)
+    
+    # Main loop
+    experiments = f.Experiments()
+    if shard:
+        experiments = Shard_Experiments(experiments, shard, f.ends, kept)
+    if queue_depth:
+        experiments = Prefetch(experiments, queue_depth)
+    if queue_depth and not binary:
+        writer = Threaded_Writer(o, queue_depth)
+    else:
+        writer = None
+    if processes > 1:
+        analyses = Experiments__Parallel(experiments, settings, cache,
+                processes, store)
+    else:
+        analyses = Experiments__Serial(experiments, settings, cache, pool,
+                store)
+    saved = time.time()
+    for analysis in analyses:
+        results, annotations, lines = analysis
+        total_score, total_tests, rows, total_planned, groups = results
+        # Output
+        if binary:
+            o.Write_Experiment(rows, annotations)
+        elif rows:
+            sb = Format_Rows(rows, width, delim, annotations)
+            if writer: writer.Write(sb)
+            else: Controlled_Output(sb, o)
+        if shard: counts.append(len(rows))
+        # Metrics
+        count_total += total_score
+        count_tests += total_tests
+        count_planned += total_planned
+        count_exp += 1
+        count_grp += groups
+        count_line += lines
+        # Journal
+        position = f.ends.popleft()
+        if journal_path and time.time() - saved >= JOURNAL_SECONDS:
+            if writer: writer.Flush()
+            if binary:
+                state = o.Get_State()
+                offset = state[0]
+            else:
+                state = None
+                offset = Sync_File(o)
+            metrics = [count_total, count_tests, count_planned, count_exp,
+                    count_grp, count_line, count_reused]
+            if store: stored = [list(store.kept.items()), store.hits]
+            else: stored = None
+            Save_Pickle(journal_path, [signature, position, offset, metrics,
+                    list(cache.entries.items()), cache.hits, cache.misses,
+                    state, [kept[:len(counts)], counts], stored])
+            saved = time.time()
+    
+    # Finish
+    if writer: writer.Close()
+    if binary: o.Close()
+    elif path_out: o.close()
+    if journal_path and os.path.exists(journal_path):
+        os.remove(journal_path)
+    f.Close()
+    cache.Save()
+    if store:
+        count_reused += store.hits
+        store.Save()
+    if pool: pool.Close()
+    metrics = [count_total, count_tests, count_exp, count_grp, count_line,
+            len(col_data), count_planned, count_tests, cache.hits,
+            cache.misses, count_reused]
+    if shard and path_out:
+        summary_path = path_out + STR__shard_suffix
+        try:
+            Save_Pickle(summary_path, [shard, bool(header and keep), metrics,
+                    kept, counts])
+        except:
+            PRINT.printE(STR__shard_write.format(f = summary_path))
+    
+    # Reporting
+    Report_Metrics(metrics)
+    
+    # Wrap up
+    return 0
+
+def Shard_Experiments(experiments, shard, ends, kept):
+    """
+    Generate the experiments generated by @experiments which belong to a
+    shard, in the same order, and skip the rest.
+    
+    @experiments
+            (iterable<[list<list>, str]>)
+            The data and the annotations of each experiment, as generated by
+            Experiment_Reader.Experiments.
+    @shard
+            (list<int>)
+            The shard number, (From 1) and the number of shards.
+    @ends
+            (collections.deque)
+            The positions after each experiment read, as kept by the
+            Experiment_Reader. The positions of skipped experiments are removed.
+    @kept
+            (list<int>)
+            The position of each experiment generated, among all the
+            experiments, is added to the end of this list. If it is not empty,
+            @experiments is assumed to start right after the last of them.
+    
+    Shard_Experiments(iterable<[list<list>, str]>, list<int>,
+            collections.deque, list<int>) -> generator<[list<list>, str]>
+    """
+    if kept: index = kept[-1] + 1
+    else: index = 0
+    for experiment in experiments:
+        if Get_Shard(experiment[0][0][0], shard[1]) == shard[0]:
+            kept.append(index)
+            yield experiment
+        else:
+            ends.pop()
+        index += 1
+
+def Get_Shard(exp_ID, shards):
+    """
+    Return the shard, from 1 to @shards, which an experiment belongs to. The
+    shard is based on the CRC-32 of the experiment ID, which is the same on
+    every computer and every version of Python.
+    
+    @exp_ID
+            (str)
+            The experiment ID.
+    @shards
+            (int)
+            The number of shards.
+    
+    Get_Shard(str, int) -> int
+    """
+    if type(exp_ID) != bytes: exp_ID = exp_ID.encode("utf-8")
+    return ((zlib.crc32(exp_ID) & 0xffffffff) % shards) + 1
+
+def Prefetch(items, depth):
+    """
+    Generate the items generated by @items, in the same order, while a separate
+    thread generates up to @depth items ahead of the ones already taken.
+    
+    Any error raised while generating the items is raised again when the item
+    it occurred at is taken.
+    
+    @items
+            (iterable)
+            The items to be generated.
+    @depth
+            (int)
+            The greatest number of items which can be waiting to be taken.
+    
+    Prefetch(iterable, int) -> generator
+    """
+    waiting = queue.Queue(depth)
+    thread = threading.Thread(target = Prefetch__Producer,
+            args = [items, waiting])
+    thread.daemon = True
+    thread.start()
+    while True:
+        more, item = waiting.get()
+        if not more: break
+        yield item
+    thread.join()
+    if item != None: raise item
+
+def Prefetch__Producer(items, waiting):
+    """
+    Put each item generated by @items into the queue @waiting, as [True, item],
+    followed by [False, None] once there are no more items. If an error is
+    raised, [False, error] is put into the queue instead, and no more items are
+    generated.
+    
+    Helper function for Prefetch. (Run by the thread)
+    
+    Prefetch__Producer(iterable, queue.Queue) -> None
+    """
+    try:
+        for item in items:
+            waiting.put([True, item])
+    except Exception as error:
+        waiting.put([False, error])
+        return
+    waiting.put([False, None])
+
+def Experiments__Serial(experiments, settings, cache, pool=None, store=None):
+    """
+    Perform the pairwise analyses on each of the experiments one at a time,
+    and generate the results, in the same order as the experiments.
+    
+    @experiments
+            (iterable<[list<list>, str]>)
+            The data and the annotations of each experiment, as generated by
+            Experiment_Reader.Experiments.
+    @settings
+            (list)
+            The arguments for Pairwise_Analyses which come after the data, and
+            before the cache.
+    @cache
+            (Null_Cache)
+            Where the results of previous comparisons are kept.
+    @pool
+            (Lazy_Pool) OR
+            (None)
+            The worker processes which share the work of large comparisons. If
+            None, every comparison is performed in this process.
+    @store
+            (Results_Store) OR
+            (None)
+            Where the results of previous runs are kept. Experiments whose
+            results are in @store are not analyzed again, and the results of
+            the others are added to it.
+    
+    Experiments__Serial(iterable<[list<list>, str]>, list, Null_Cache,
+            Lazy_Pool, Results_Store) -> generator<[list, str, int]>
+    
+    The values generated for each experiment are:
+        (list) - The values returned by Pairwise_Analyses
+        (str)  - The annotations to be kept
+        (int)  - The number of rows of data
+    """
+    for data, annotations in experiments:
+        if store:
+            key = store.Get_Key(data)
+            results = store.Get(key)
+        else:
+            results = None
+        if results == None:
+            results = Pairwise_Analyses(*([data] + settings + [cache, pool]))
+            if store: store.Put(key, results)
+        yield [results, annotations, len(data)]
+
+def Experiments__Parallel(experiments, settings, cache, processes,
+            store=None):
+    """
+    Same as Experiments__Serial, except that the pairwise analyses are
+    performed by a pool of @processes worker processes.
+    
+    No more than (@processes * IN_FLIGHT_PER_PROCESS) experiments are taken
+    ahead of the oldest experiment which has not been generated yet, so the
+    memory used is limited even if some experiments take much longer than
+    others. The results calculated by the workers are added to @cache.
+    Experiments whose results are in @store are not sent to the workers.
+    
+    Experiments__Parallel(iterable<[list<list>, str]>, list, Null_Cache,
+            int, Results_Store) -> generator<[list, str, int]>
+    """
+    experiments = iter(experiments)
+    entries = list(cache.entries.items())
+    pool = multiprocessing.Pool(processes, Initialize_Worker,
+            [cache.capacity, entries])
+    in_flight = collections.deque()
+    limit = processes * IN_FLIGHT_PER_PROCESS
+    more = True
+    try:
+        while more or in_flight:
+            # Queue up more experiments
+            if more and len(in_flight) < limit:
+                experiment = next(experiments, None)
+                if experiment == None:
+                    more = False
+                    continue
+                data, annotations = experiment
+                if store:
+                    key = store.Get_Key(data)
+                    results = store.entries.get(key)
+                else:
+                    key = None
+                    results = None
+                if results == None:
+                    job = pool.apply_async(Pairwise_Analyses__Worker,
+                            [[data] + settings])
+                else:
+                    job = None
+                in_flight.append([job, key, results, annotations, len(data)])
+                continue
+            # Wait for the oldest experiment
+            job, key, results, annotations, lines = in_flight.popleft()
+            if job:
+                results, added, hits, misses = job.get()
+                for entry, summary in added:
+                    cache.Put(entry, summary)
+                cache.hits += hits
+                cache.misses += misses
+                if store: store.Put(key, results)
+            elif store: store.Get(key) # Only counted once it is output
+            yield [results, annotations, lines]
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+WORKER_CACHE = None # The cache of a worker process
+
+def Initialize_Worker(cache_size, entries):
+    """
+    Set up the cache of a worker process for Experiments__Parallel.
+    
+    @cache_size
+            (int)
+            The number of results to keep.
+    @entries
+            (list<[tuple, list]>)
+            The results to start with, as [key, summary] pairs.
+    
+    Initialize_Worker(int, list<[tuple, list]>) -> None
+    """
+    global WORKER_CACHE
+    WORKER_CACHE = Null_Cache(cache_size)
+    for key, summary in entries:
+        WORKER_CACHE.Put(key, summary)
+    WORKER_CACHE.Take_Added()
+
+def Pairwise_Analyses__Worker(arguments):
+    """
+    Call Pairwise_Analyses in a worker process with the cache of the worker.
+    Return the results, along with the results added to the cache and the
+    number of cache hits and misses.
+    
+    @arguments
+            (list)
+            The arguments for Pairwise_Analyses, except for the cache.
+    
+    Pairwise_Analyses__Worker(list) ->
+            [list, list<[tuple, list]>, int, int]
+    """
+    cache = WORKER_CACHE
+    hits = cache.hits
+    misses = cache.misses
+    results = Pairwise_Analyses(*(arguments + [cache]))
+    return [results, cache.Take_Added(), cache.hits - hits,
+            cache.misses - misses]
+
+def Pairwise_Analyses(data, test_type, directional, engine=DEFAULT__engine,
+            block_size=DEFAULT__block_size, draws=DEFAULT__draws,
+            budget=DEFAULT__budget, seed=DEFAULT__seed,
+            exceedances=DEFAULT__exceedances, resolutions=DEFAULT__resolutions,
+            cache=None, pool=None):
+    """
+    Perform the relevant pairwise analyses and return the metrics of the
+    resulting analysis and the strings to be output to the data file as a list
+    of lists.
+    
+    @data
+            (list<list>)
+            A list of lists. Each sublist contains the data for one sample.
             The first value of the sublist is the experiment ID, a string.
             The second value is the group ID, also a string.
             The rest are data values as floats. If a value is missing, it will
@@ -470,167 +2770,2074 @@ def Pairwise_Analyses(data, test_type, directional):
             The options are as follows:
                 1 - Frequentist
                 2 - Standard Deviation
+                3 - Rank Sum
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    @engine
+            (int - ENUM)
+            An integer denoting how the possible relabellings of the groups are
+            to be generated. The options are as follows:
+                1 - Permutator
+                2 - Combinations
+                3 - Analytic (Standard Deviation tests only)
+                4 - NumPy
+                5 - Gray Code
+                6 - Dynamic Programming (Frequentist tests only)
+                7 - Meet in the Middle (Frequentist tests only)
+                8 - Edgeworth (Frequentist tests only)
+    @block_size
+            (int)
+            The number of relabellings to be evaluated at once.
+    @draws
+            (int)
+            The number of random relabellings to evaluate for comparisons which
+            have more possible relabellings than @budget.
+    @budget
+            (int) OR
+            (None)
+            The largest number of possible relabellings which will all be
+            evaluated. If None, all possible relabellings are always evaluated.
+            If this or @exceedances is not None, each result will also contain
+            the standard error of the p-value, the method used, and the number
+            of relabellings evaluated.
+    @seed
+            (int)
+            The seed for the random number generator.
+    @exceedances
+            (int) OR
+            (None)
+            The number of extreme random relabellings at which sampling stops,
+            for Frequentist tests with too many possible relabellings. If None,
+            sampling never stops early.
+    @resolutions
+            (list<float>) OR
+            (None)
+            The resolution of each column of data, for the Dynamic Programming
+            engine. If None, the resolutions are detected.
+    @cache
+            (Null_Cache) OR
+            (None)
+            Where the results of previous comparisons are kept. If None, no
+            results are reused.
+    @pool
+            (Lazy_Pool) OR
+            (None)
+            The worker processes which share the work of large comparisons. If
+            None, every comparison is performed in this process.
+    
+    Pairwise_Analyses(<list<list>>, int, bool, int, int, int, int, int, int,
+            list<float>, Null_Cache, Lazy_Pool) ->
+            [float, int, list<list>, int, int]
+    
+    The values returned are:
+        (float)           - The summed p-values of all tests performed
+        (int)             - The number of tests performed
+        (list<list>)      - The results to be output, one list per pair of
+                            groups
+        (int)             - The number of tests planned
+        (int)             - The number of distinct groups
+    
+    Each list of results contains the experiment ID and the two group IDs,
+    followed by the p-value and the group ID of the higher value group for each
+    column. If @budget or @exceedances is not None, or the Edgeworth engine is
+    used, the p-value is followed by the standard error, the METHOD ENUM of the
+    method used, and the number of relabellings evaluated.
+    
+    Comparisons where either group has no values in a column are not
+    performed. Their p-value, standard error, method and higher value group are
+    None, and the number of relabellings evaluated is 0. (See Format_Rows)
+    """
+    # Setup - results
+    results = []
+    
+    # Setup - reading
+    length = len(data[0])
+    length_ = length - 2
+    range_ = range(length_)
+    exp_ID = data[0][0]
+    
+    group_IDs = []
+    for row in data:
+        group_ID = row[1]
+        group_IDs.append(group_ID)
+    group_IDs = sorted(set(group_IDs))
+    
+    # Setup - metrics
+    total_score = 0.0
+    total_tests = 0
+    total_planned = 0
+    
+    # Setup - output
+    extended = ((budget != None) or (exceedances != None) or
+            (engine == ENGINE.EDGEWORTH))
+    
+    # Subsets
+    subsets = {}
+    masks = {} # Which rows of each group have values, for each column
+    rows = {}
+    for group_ID in group_IDs:
+        temp = []
+        temp_masks = []
+        for i in range_:
+            temp.append([]) # Necessary to ensure hardcopying
+            temp_masks.append([])
+        subsets[group_ID] = temp
+        masks[group_ID] = temp_masks
+        rows[group_ID] = 0
+    for row in data:
+        group_ID = row[1]
+        for i in range(2, length):
+            value = row[i]
+            if value:
+                subsets[group_ID][i-2].append(value)
+                masks[group_ID][i-2].append(rows[group_ID])
+        rows[group_ID] += 1
+    # Pairs
+    pairs = Schedule_Comparisons(group_IDs)
+    
+    for pair in pairs:
+        # Unpack
+        g1, g2 = pair
+        
+        # Setup
+        row_result = [exp_ID, g1, g2]
+        
+        # Columns with the same missing values share their relabellings
+        shared_results = {}
+        if engine == ENGINE.NUMPY and test_type != TEST.RANK:
+            column_groups = Group_Columns_By_Mask(masks[g1], masks[g2])
+            for columns in column_groups:
+                len_1 = len(masks[g1][columns[0]])
+                len_2 = len(masks[g2][columns[0]])
+                if len(columns) < 2 or not (len_1 and len_2): continue
+                total = Binomial(len_1 + len_2, len_1)
+                method = Choose_Method(total, test_type, draws, budget,
+                        exceedances)
+                if method != METHOD.EXHAUSTIVE: continue
+                if pool and total > block_size * RANGE_BLOCKS: continue
+                columns_1 = [subsets[g1][i] for i in columns]
+                columns_2 = [subsets[g2][i] for i in columns]
+                test_results = Permutation_Tests__Shared(columns_1, columns_2,
+                        test_type, directional, block_size, cache)
+                for i, test_result in zip(columns, test_results):
+                    shared_results[i] = test_result
+        
+        # All columns
+        for i in range_:
+            
+            # From subset
+            values_1 = subsets[g1][i]
+            values_2 = subsets[g2][i]
+            len_1 = len(values_1)
+            len_2 = len(values_2)
+            total_planned += 1
+            
+            # Nothing to compare
+            if not (len_1 and len_2):
+                row_result.append(None)
+                if extended:
+                    row_result += [None, None, 0]
+                row_result.append(None)
+                continue
+            
+            # Test
+            if i in shared_results:
+                test_result = shared_results[i]
+            else:
+                comparison_seed = Get_Comparison_Seed(seed, exp_ID, g1, g2, i)
+                if resolutions: resolution = resolutions[i]
+                else: resolution = None
+                test_result = Permutation_Test(values_1, values_2, test_type,
+                        directional, engine, block_size, draws, budget,
+                        comparison_seed, exceedances, resolution, cache, pool)
+            p_value, error, method, evaluated, larger_is_1 = test_result
+            if larger_is_1: larger = g1
+            else: larger = g2
+            total_score += p_value
+            total_tests += 1
+            
+            # Results
+            row_result.append(p_value)
+            if extended:
+                row_result.append(error)
+                row_result.append(method)
+                row_result.append(evaluated)
+            row_result.append(larger)
+            
+        results.append(row_result)
+    
+    # Return
+    return [total_score, total_tests, results, total_planned, len(group_IDs)]
+
+def Group_Columns_By_Mask(masks_1, masks_2):
+    """
+    Group together the columns of data which have values in exactly the same
+    rows of both groups. Return a list of groups of column numbers.
+    
+    @masks_1
+            (list<list<int>>)
+            For each column, the rows of the first group which have values.
+    @masks_2
+            (list<list<int>>)
+            For each column, the rows of the second group which have values.
+    
+    Group_Columns_By_Mask(list<list<int>>, list<list<int>>) ->
+            list<list<int>>
+    """
+    groups = {}
+    keys = []
+    for i in range(len(masks_1)):
+        key = (tuple(masks_1[i]), tuple(masks_2[i]))
+        if key not in groups:
+            groups[key] = []
+            keys.append(key)
+        groups[key].append(i)
+    return [groups[key] for key in keys]
+
+def Schedule_Comparisons(group_IDs):
+    """
+    Return every pair of distinct groups to be compared, with each unordered
+    pair appearing once. The groups in each pair, and the pairs themselves,
+    are sorted.
+    
+    @group_IDs
+            (list<str>)
+            The group IDs. May contain duplicates.
+    
+    Schedule_Comparisons(list<str>) -> list<[str, str]>
+    """
+    group_IDs = sorted(set(group_IDs))
+    pairs = []
+    for g1, g2 in itertools.combinations(group_IDs, 2):
+        pairs.append([g1, g2])
+    return pairs
+
+def Permutation_Test(values_1, values_2, test_type, directional, engine,
+            block_size, draws, budget, seed, exceedances=None,
+            resolution=None, cache=None, pool=None):
+    """
+    Perform a single permutation test between two groups of values, and return
+    the p-value along with a description of how it was obtained.
+    
+    If there are more possible relabellings than @budget, @draws random
+    relabellings are evaluated instead of all of them.
+    
+    If @exceedances is specified for a Frequentist test, and there are more
+    possible relabellings than @budget, (Or @draws, if there is no budget)
+    random relabellings are instead evaluated until @exceedances of them were
+    at least as extreme as the original, or until @draws of them have been
+    evaluated. (Besag and Clifford's sequential Monte Carlo test)
+    
+    @values_1
+            (list<float>)
+            The values of the first group.
+    @values_2
+            (list<float>)
+            The values of the second group.
+    @test_type
+            (int - ENUM)
+            An integer denoting what kind of test will be performed on the data.
+            The options are as follows:
+                1 - Frequentist
+                2 - Standard Deviation
+                3 - Rank Sum
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    @engine
+            (int - ENUM)
+            An integer denoting how the possible relabellings of the groups are
+            to be generated.
+    @block_size
+            (int)
+            The number of relabellings to be evaluated at once.
+    @draws
+            (int)
+            The number of random relabellings to evaluate if there are too
+            many possible relabellings.
+    @budget
+            (int) OR
+            (None)
+            The largest number of possible relabellings which will all be
+            evaluated. If None, all possible relabellings are always evaluated.
+    @seed
+            (int)
+            The seed for the random number generator.
+    @exceedances
+            (int) OR
+            (None)
+            The number of extreme random relabellings at which sampling stops.
+            (Frequentist tests only) If None, sampling never stops early.
+    @resolution
+            (float) OR
+            (None)
+            The resolution of the values, for the Dynamic Programming engine.
+            If None, the resolution is detected.
+    @cache
+            (Null_Cache) OR
+            (None)
+            Where the results of previous comparisons are kept. If the same
+            null distribution has been calculated before, it is not calculated
+            again. Only exact results are kept.
+    @pool
+            (Lazy_Pool) OR
+            (None)
+            The worker processes which share the work of evaluating all the
+            relabellings, if there are more than (@block_size * RANGE_BLOCKS)
+            of them. If None, they are all evaluated in this process.
+    
+    Permutation_Test(list<float>, list<float>, int, bool, int, int, int, int,
+            int, int, float, Null_Cache, Lazy_Pool) ->
+            [float, float, int, int, bool]
+    
+    The values returned are:
+        (float) - The p-value
+        (float) - The standard error of the p-value (0 if it is exact)
+        (int)   - The METHOD ENUM of the method used
+        (int)   - The number of relabellings evaluated
+        (bool)  - Whether the first group had the larger average
+    """
+    # Original
+    len_1 = len(values_1)
+    len_2 = len(values_2)
+    avg_1 = sum(values_1)/len_1
+    avg_2 = sum(values_2)/len_2
+    if avg_1 > avg_2:
+        larger_is_1 = True
+        difference = avg_1 - avg_2
+    else:
+        larger_is_1 = False
+        difference = avg_2 - avg_1
+    values = values_1 + values_2
+    tolerance = TOLERANCE * max([abs(value) for value in values])
+    
+    # Calculate p-value without generating any relabellings
+    if test_type == TEST.RANK:
+        return Rank_Sum_Test(values_1, values_2, directional, cache)
+    if test_type == TEST.SDEV and engine == ENGINE.ANALYTIC:
+        sd = Calculate_SD__Analytic(values, len_1, len_2)
+        p_value = Calculate_P_Value__SD(difference, sd, directional)
+        return [p_value, 0.0, METHOD.ANALYTIC, 0, larger_is_1]
+    
+    # Previously calculated
+    accumulator = New_Accumulator(difference, test_type, directional,
+            tolerance)
+    if cache != None:
+        key = Get_Cache_Key(values_1, values_2, larger_is_1, test_type,
+                directional)
+        summary = cache.Get(key)
+        if summary != None:
+            accumulator.Add_Summary(summary)
+            p_value = accumulator.Get_P_Value()
+            return [p_value, 0.0, METHOD.EXHAUSTIVE, accumulator.total,
+                    larger_is_1]
+    
+    # Approximate the p-value without generating any relabellings
+    total = Binomial(len_1 + len_2, len_1)
+    if test_type == TEST.FREQ and engine == ENGINE.EDGEWORTH and (budget ==
+            None or total > budget) and (len_1 + len_2 >=
+            EDGEWORTH_MIN_VALUES):
+        p_value = Calculate_P_Value__Edgeworth(values, len_1, len_2,
+                larger_is_1, difference, tolerance)
+        return [p_value, 0.0, METHOD.EDGEWORTH, 0, larger_is_1]
+    
+    # Count the relabellings without generating them
+    if test_type == TEST.FREQ and engine in [ENGINE.DYNAMIC, ENGINE.MIDDLE]:
+        if engine == ENGINE.DYNAMIC:
+            counts = Count_Relabellings__Dynamic(values, len_1, len_2,
+                    larger_is_1, resolution)
+        else:
+            counts = Count_Relabellings__Middle(values, len_1, len_2,
+                    larger_is_1, difference, tolerance)
+        if counts:
+            if cache != None: cache.Put(key, counts)
+            accumulator.Add_Summary(counts)
+            p_value = accumulator.Get_P_Value()
+            return [p_value, 0.0, METHOD.EXHAUSTIVE, accumulator.total,
+                    larger_is_1]
+    
+    # Differences, in batches
+    method = Choose_Method(total, test_type, draws, budget, exceedances)
+    summaries = None
+    if method == METHOD.SEQUENTIAL:
+        size = min(block_size, exceedances)
+        if engine == ENGINE.NUMPY:
+            batches = Permutation_Differences__Monte_Carlo_NumPy(values,
+                    len_1, len_2, larger_is_1, size, draws, seed)
+        else:
+            batches = Permutation_Differences__Monte_Carlo(values, len_1,
+                    len_2, larger_is_1, size, draws, seed)
+    elif method == METHOD.MONTE_CARLO:
+        if engine == ENGINE.NUMPY:
+            batches = Permutation_Differences__Monte_Carlo_NumPy(values,
+                    len_1, len_2, larger_is_1, block_size, draws, seed)
+        else:
+            batches = Permutation_Differences__Monte_Carlo(values, len_1,
+                    len_2, larger_is_1, block_size, draws, seed)
+    elif pool and engine in LIST__ranged_engines and (total > block_size *
+            RANGE_BLOCKS):
+        summaries = Permutation_Summaries__Ranges(pool, values, len_1, len_2,
+                larger_is_1, difference, tolerance, test_type, directional,
+                engine, block_size)
+    else:
+        if engine == ENGINE.PERMUTATOR:
+            batches = Permutation_Differences__Permutator(values, len_1,
+                    len_2, larger_is_1, block_size)
+        elif engine == ENGINE.NUMPY:
+            batches = Permutation_Differences__NumPy(values, len_1, len_2,
+                    larger_is_1, block_size)
+        elif engine == ENGINE.GRAY_CODE:
+            batches = Permutation_Differences__Gray_Code(values, len_1, len_2,
+                    larger_is_1, block_size)
+        else:
+            batches = Permutation_Differences__Combinations(values, len_1,
+                    len_2, larger_is_1, block_size)
+    
+    # Calculate p-value
+    if method == METHOD.SEQUENTIAL:
+        for batch in batches:
+            if accumulator.Add_Batch_Until(batch, exceedances): break
+    elif summaries:
+        for summary in summaries:
+            accumulator.Add_Summary(summary)
+    else:
+        for batch in batches:
+            accumulator.Add_Batch(batch)
+    p_value = accumulator.Get_P_Value()
+    if method == METHOD.SEQUENTIAL:
+        p_value = accumulator.Get_P_Value__Sampled(exceedances)
+        error = accumulator.Get_Standard_Error(exceedances)
+    elif method == METHOD.MONTE_CARLO:
+        if test_type == TEST.FREQ:
+            p_value = accumulator.Get_P_Value__Sampled()
+        error = accumulator.Get_Standard_Error()
+    else:
+        error = 0.0
+        if cache != None: cache.Put(key, accumulator.Get_Summary())
+    return [p_value, error, method, accumulator.total, larger_is_1]
+
+def Permutation_Tests__Shared(columns_1, columns_2, test_type, directional,
+            block_size, cache=None):
+    """
+    Perform permutation tests between two groups of values for several columns
+    of data at once, evaluating every possible relabelling of the groups. Each
+    relabelling is generated once and used for every column. Return a list of
+    results, one per column, in the same format as Permutation_Test.
+    
+    The relabellings are evaluated in blocks using NumPy, as a matrix of
+    indicators multiplied by the matrix of values.
+    
+    Every column must have the same number of values in each group, with
+    missing values in the same rows.
+    
+    @columns_1
+            (list<list<float>>)
+            The values of the first group, one list per column.
+    @columns_2
+            (list<list<float>>)
+            The values of the second group, one list per column.
+    @test_type
+            (int - ENUM)
+            An integer denoting what kind of test will be performed on the data.
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    @block_size
+            (int)
+            The number of relabellings to be evaluated at once.
+    @cache
+            (Null_Cache) OR
+            (None)
+            Where the results of previous comparisons are kept.
+    
+    Permutation_Tests__Shared(list<list<float>>, list<list<float>>, int, bool,
+            int, Null_Cache) -> list<[float, float, int, int, bool]>
+    """
+    len_1 = len(columns_1[0])
+    len_2 = len(columns_2[0])
+    results = []
+    pending = []
+    for c in range(len(columns_1)):
+        values_1 = columns_1[c]
+        values_2 = columns_2[c]
+        # Original
+        avg_1 = sum(values_1)/len_1
+        avg_2 = sum(values_2)/len_2
+        if avg_1 > avg_2:
+            larger_is_1 = True
+            difference = avg_1 - avg_2
+        else:
+            larger_is_1 = False
+            difference = avg_2 - avg_1
+        values = values_1 + values_2
+        tolerance = TOLERANCE * max([abs(value) for value in values])
+        accumulator = New_Accumulator(difference, test_type, directional,
+                tolerance)
+        result = [None, 0.0, METHOD.EXHAUSTIVE, 0, larger_is_1]
+        results.append(result)
+        # Previously calculated
+        key = None
+        if cache != None:
+            key = Get_Cache_Key(values_1, values_2, larger_is_1, test_type,
+                    directional)
+            summary = cache.Get(key)
+            if summary != None:
+                accumulator.Add_Summary(summary)
+                result[0] = accumulator.Get_P_Value()
+                result[3] = accumulator.total
+                continue
+        pending.append([result, accumulator, values, key])
+    if not pending: return results
+    
+    # Differences, in batches, for all remaining columns
+    matrix = [entry[2] for entry in pending]
+    larger = [entry[0][4] for entry in pending]
+    batches = Permutation_Differences__Shared(matrix, len_1, len_2, larger,
+            block_size)
+    for batch in batches:
+        for c in range(len(pending)):
+            pending[c][1].Add_Batch(batch[c])
+    
+    # Calculate p-values
+    for result, accumulator, values, key in pending:
+        result[0] = accumulator.Get_P_Value()
+        result[3] = accumulator.total
+        if cache != None: cache.Put(key, accumulator.Get_Summary())
+    return results
+
+def Choose_Method(total, test_type, draws, budget, exceedances):
+    """
+    Return the METHOD ENUM of the method used to evaluate a comparison with
+    @total possible relabellings.
+    
+    @total
+            (int)
+            The number of possible relabellings.
+    @test_type
+            (int - ENUM)
+            An integer denoting what kind of test will be performed on the data.
+    @draws
+            (int)
+            The number of random relabellings to evaluate if there are too
+            many possible relabellings.
+    @budget
+            (int) OR
+            (None)
+            The largest number of possible relabellings which will all be
+            evaluated. If None, all possible relabellings are always evaluated.
+    @exceedances
+            (int) OR
+            (None)
+            The number of extreme random relabellings at which sampling stops.
+            (Frequentist tests only) If None, sampling never stops early.
+    
+    Choose_Method(int, int, int, int, int) -> int
+    """
+    if budget == None: limit = draws
+    else: limit = budget
+    if test_type == TEST.FREQ and exceedances != None and total > limit:
+        return METHOD.SEQUENTIAL
+    if budget != None and total > budget:
+        return METHOD.MONTE_CARLO
+    return METHOD.EXHAUSTIVE
+
+def Get_Cache_Key(values_1, values_2, larger_is_1, test_type, directional):
+    """
+    Return a key which identifies the null distribution of a comparison, for
+    use with a Null_Cache.
+    
+    The pooled values are sorted, so the key does not depend on the order of
+    the values or of the groups. For Standard Deviation tests, only the
+    standard deviation of the permutation differences is needed, which is the
+    same for any split of the pooled values into groups of the same sizes. For
+    Frequentist tests, the size and exact total of the group with the larger
+    average determine the observed difference.
+    
+    @values_1
+            (list<float>)
+            The values of the first group.
+    @values_2
+            (list<float>)
+            The values of the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+    @test_type
+            (int - ENUM)
+            An integer denoting what kind of test will be performed on the data.
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    
+    Get_Cache_Key(list<float>, list<float>, bool, int, bool) -> tuple
+    """
+    values = tuple(sorted(values_1 + values_2))
+    if test_type == TEST.SDEV:
+        return (test_type, values, min(len(values_1), len(values_2)))
+    if larger_is_1: larger = values_1
+    else: larger = values_2
+    return (test_type, directional, values, len(larger), math.fsum(larger))
+
+def Get_Comparison_Seed(seed, exp_ID, g1, g2, column):
+    """
+    Return a seed for the random number generator which is unique to one
+    comparison, so that the random relabellings used for a comparison do not
+    depend on which comparisons were performed before it. The seed is taken
+    from a SHA-1 hash, so it does not depend on the version of Python or on
+    hash randomization.
+    
+    @seed
+            (int)
+            The seed specified by the user.
+    @exp_ID
+            (str)
+            The experiment ID.
+    @g1
+            (str)
+            The ID of the first group being compared.
+    @g2
+            (str)
+            The ID of the second group being compared.
+    @column
+            (int)
+            The index of the data column being compared.
+    
+    Get_Comparison_Seed(int, str, str, str, int) -> int
+    """
+    string = "\t".join([str(seed), exp_ID, g1, g2, str(column)])
+    if type(string) != bytes: string = string.encode("utf-8")
+    return int(hashlib.sha1(string).hexdigest()[:8], 16)
+
+def Permutation_Summaries__Ranges(pool, values, len_1, len_2, larger_is_1,
+            difference, tolerance, test_type, directional, engine, block_size):
+    """
+    Generate the summaries of the permutation differences for every way of
+    splitting the pooled values into two groups of the original sizes, one
+    summary per batch of @block_size relabellings, in order.
+    
+    The relabellings are split into ranges of consecutive ranks, each
+    (@block_size * RANGE_BLOCKS) long, which are evaluated in parallel by the
+    worker processes of @pool. As the ranges do not depend on the number of
+    workers, and the summaries are generated in the same order as the batches
+    would be evaluated in a single process, the resulting p-values are
+    identical regardless of the number of workers.
+    
+    @pool
+            (Lazy_Pool)
+            The worker processes.
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+    @difference
+            (float)
+            The actual difference observed.
+    @tolerance
+            (float)
+            How much smaller than @difference a permutation difference can be
+            and still be counted as being at least as large.
+    @test_type
+            (int - ENUM)
+            An integer denoting what kind of test will be performed on the data.
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    @engine
+            (int - ENUM)
+            An integer denoting how the relabellings are to be generated. Only
+            the Permutator, Combinations, and NumPy engines are supported.
+    @block_size
+            (int)
+            The number of relabellings in each batch.
+    
+    Permutation_Summaries__Ranges(Lazy_Pool, list<float>, int,
+            int, bool, float, float, int, bool, int, int) -> generator<list>
+    """
+    total = Binomial(len_1 + len_2, len_1)
+    size = block_size * RANGE_BLOCKS
+    ranges = Rank_Ranges(total, size)
+    arguments = ([values, len_1, len_2, larger_is_1, difference, tolerance,
+            test_type, directional, engine, block_size, start, stop]
+            for start, stop in ranges)
+    for summaries in pool.imap(Permutation_Range__Worker, arguments):
+        for summary in summaries:
+            yield summary
+
+def Permutation_Range__Worker(arguments):
+    """
+    Evaluate one range of relabellings in a worker process, and return the
+    summary of each batch of permutation differences, in order.
+    
+    @arguments
+            (list)
+            The values, group sizes, original direction, observed difference,
+            tolerance, test type, directionality, engine, block size, and the
+            ranks of the first relabelling in the range and of the relabelling
+            after the range, as passed by Permutation_Summaries__Ranges.
+    
+    Permutation_Range__Worker(list) -> list<list>
+    """
+    values, len_1, len_2, larger_is_1, difference, tolerance = arguments[:6]
+    test_type, directional, engine, block_size, start, stop = arguments[6:]
+    if engine == ENGINE.PERMUTATOR:
+        batches = Permutation_Differences__Permutator(values, len_1, len_2,
+                larger_is_1, block_size, start, stop)
+    elif engine == ENGINE.NUMPY:
+        batches = Permutation_Differences__NumPy(values, len_1, len_2,
+                larger_is_1, block_size, start, stop)
+    else:
+        batches = Permutation_Differences__Combinations(values, len_1, len_2,
+                larger_is_1, block_size, start, stop)
+    summaries = []
+    for batch in batches:
+        accumulator = New_Accumulator(difference, test_type, directional,
+                tolerance)
+        accumulator.Add_Batch(batch)
+        summaries.append(accumulator.Get_Summary())
+    return summaries
+
+def Rank_Ranges(total, size):
+    """
+    Generate the ranges of consecutive ranks which split up @total items into
+    ranges of @size items. (Except for the last range, which may be shorter)
+    Each range is given as the rank of its first item and the rank of the item
+    after it.
+    
+    Rank_Ranges(int, int) -> generator<[int, int]>
+    """
+    start = 0
+    while start < total:
+        stop = min(start + size, total)
+        yield [start, stop]
+        start = stop
+
+def Permutation_Differences__Permutator(values, len_1, len_2, larger_is_1,
+            block_size, start=0, stop=None):
+    """
+    Generate the differences between the group averages for every permutation
+    of the group IDs, in batches of at most @block_size. Every distinct
+    assignment of the group IDs is generated once, on demand, by
+    Lazy_Relabellings.
+    
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+            The differences are calculated as the average of that group minus
+            the average of the other group.
+    @block_size
+            (int)
+            The maximum number of differences in each batch.
+    @start
+            (int)
+            The rank of the first assignment to be evaluated.
+    @stop
+            (int) OR
+            (None)
+            The rank of the assignment to stop at. (Not evaluated) If None, all
+            assignments from @start onwards are evaluated.
+    
+    Permutation_Differences__Permutator(list<float>, int, int, bool, int,
+            int, int) -> generator<list<float>>
+    """
+    permutations = Lazy_Relabellings(len_1, len_2, start, stop)
+    range_both = range(len_1 + len_2)
+    differences = []
+    for permutation in permutations:
+        total_g1 = 0
+        total_g2 = 0
+        for i in range_both:
+            if permutation[i] == 1:
+                total_g1 += values[i]
+            else:
+                total_g2 += values[i]
+        avg_1 = total_g1/len_1
+        avg_2 = total_g2/len_2
+        if larger_is_1:
+            differences.append(avg_1 - avg_2)
+        else:
+            differences.append(avg_2 - avg_1)
+        if len(differences) == block_size:
+            yield differences
+            differences = []
+    if differences:
+        yield differences
+
+def Permutation_Differences__Combinations(values, len_1, len_2, larger_is_1,
+            block_size, start=0, stop=None):
+    """
+    Generate the differences between the group averages for every way of
+    splitting the pooled values into two groups of the original sizes, in
+    batches of at most @block_size.
+    
+    Each subset of the pooled values which could make up the first group is
+    generated exactly once. The total of the second group is derived from the
+    total of the pooled values.
+    
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+            The differences are calculated as the average of that group minus
+            the average of the other group.
+    @block_size
+            (int)
+            The maximum number of differences in each batch.
+    @start
+            (int)
+            The rank of the first subset to be evaluated.
+    @stop
+            (int) OR
+            (None)
+            The rank of the subset to stop at. (Not evaluated) If None, all
+            subsets from @start onwards are evaluated.
+    
+    Permutation_Differences__Combinations(list<float>, int, int, bool, int,
+            int, int) -> generator<list<float>>
+    """
+    total = sum(values)
+    if start == 0 and stop == None:
+        combinations = itertools.combinations(values, len_1)
+    else:
+        indexes = Lazy_Combinations(len(values), len_1, start, stop)
+        combinations = ([values[i] for i in combination]
+                for combination in indexes)
+    while True:
+        differences = []
+        for combination in itertools.islice(combinations, block_size):
+            total_g1 = sum(combination)
+            avg_1 = total_g1/len_1
+            avg_2 = (total - total_g1)/len_2
+            if larger_is_1:
+                differences.append(avg_1 - avg_2)
+            else:
+                differences.append(avg_2 - avg_1)
+        if not differences: break
+        yield differences
+
+def Permutation_Differences__NumPy(values, len_1, len_2, larger_is_1,
+            block_size, start=0, stop=None):
+    """
+    Generate the differences between the group averages for every way of
+    splitting the pooled values into two groups of the original sizes, in
+    batches of at most @block_size.
+    
+    Same as Permutation_Differences__Combinations, except that the subsets are
+    processed in blocks. Each block is a matrix of the indexes of the values in
+    the first group, one row per subset, generated by Combination_Blocks. The
+    totals of every subset in the block are calculated at once using NumPy.
+    Each batch is a NumPy array.
+    
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+            The differences are calculated as the average of that group minus
+            the average of the other group.
+    @block_size
+            (int)
+            The maximum number of subsets to be processed at once.
+    @start
+            (int)
+            The rank of the first subset to be evaluated.
+    @stop
+            (int) OR
+            (None)
+            The rank of the subset to stop at. (Not evaluated) If None, all
+            subsets from @start onwards are evaluated.
+    
+    Permutation_Differences__NumPy(list<float>, int, int, bool, int, int,
+            int) -> generator<numpy.ndarray<float>>
+    """
+    array = numpy.array(values, dtype = numpy.float64)
+    total = sum(values)
+    for indexes in Combination_Blocks(len_1 + len_2, len_1, block_size, start,
+            stop):
+        totals_g1 = array[indexes].sum(axis = 1)
+        avgs_1 = totals_g1/len_1
+        avgs_2 = (total - totals_g1)/len_2
+        if larger_is_1:
+            yield avgs_1 - avgs_2
+        else:
+            yield avgs_2 - avgs_1
+
+def Permutation_Differences__Gray_Code(values, len_1, len_2, larger_is_1,
+            block_size):
+    """
+    Generate the differences between the group averages for every way of
+    splitting the pooled values into two groups of the original sizes, in
+    batches of at most @block_size.
+    
+    Same as Permutation_Differences__Combinations, except that the subsets are
+    generated in revolving door order. (A Gray code for combinations, where
+    each subset differs from the previous one by one value leaving the first
+    group and one value entering it) The order is built from its recursive
+    definition, in Knuth's The Art of Computer Programming, Volume 4A, section
+    7.2.1.3: the subsets of size k of the first n values are those of the
+    first (n - 1) values, followed by the subsets of size (k - 1) of the first
+    (n - 1) values in reverse order, each with value n added.
+    
+    Each difference is the total of the first group, weighted, plus a
+    constant, so the values are weighted in advance. The weighted totals of
+    the subsets of the first few values are kept in tables, and every
+    difference is one addition to a table entry.
+    
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+            The differences are calculated as the average of that group minus
+            the average of the other group.
+    @block_size
+            (int)
+            The maximum number of differences in each batch.
+    
+    Permutation_Differences__Gray_Code(list<float>, int, int, bool, int)
+            -> generator<list<float>>
+    """
+    if larger_is_1: sign = 1.0
+    else: sign = -1.0
+    scale = sign * ((1.0/len_1) + (1.0/len_2))
+    weights = [value * scale for value in values]
+    base = (-sign * sum(values))/len_2
+    tables = {}
+    differences = []
+    # Parts still to be generated: [values, subset size, reversed, offset]
+    stack = [[len_1 + len_2, len_1, False, base]]
+    while stack:
+        length, size, backwards, offset = stack.pop()
+        if Binomial(length, size) <= GRAY_CODE_TABLE:
+            table = Gray_Code_Table(length, size, weights, tables)
+            if backwards: table = table[::-1]
+            differences += [offset + total for total in table]
+            while len(differences) >= block_size:
+                yield differences[:block_size]
+                differences = differences[block_size:]
+            continue
+        first = [length - 1, size, backwards, offset]
+        second = [length - 1, size - 1, not backwards,
+                offset + weights[length - 1]]
+        if backwards: stack += [first, second] # Second part first
+        else: stack += [second, first]
+    if differences:
+        yield differences
+
+def Gray_Code_Table(length, size, weights, tables):
+    """
+    Return a list of the totals of the weights of every subset of size @size
+    of the first @length weights, in revolving door order. Tables are built
+    from smaller tables and stored in @tables for reuse.
+    
+    Helper function for Permutation_Differences__Gray_Code.
+    
+    Gray_Code_Table(int, int, list<float>, dict<(int, int):list<float>>) ->
+            list<float>
+    """
+    key = (length, size)
+    if key in tables: return tables[key]
+    if size == 0:
+        table = [0.0]
+    elif size == length:
+        table = [sum(weights[:length])]
+    else:
+        last = weights[length - 1]
+        table = Gray_Code_Table(length - 1, size, weights, tables)
+        rest = Gray_Code_Table(length - 1, size - 1, weights, tables)
+        table = table + [total + last for total in reversed(rest)]
+    tables[key] = table
+    return table
+
+def Permutation_Differences__Shared(matrix, len_1, len_2, larger_is_1,
+            block_size):
+    """
+    Generate the differences between the group averages for every way of
+    splitting the pooled values into two groups of the original sizes, for
+    several columns of data at once, in batches of at most @block_size.
+    
+    Same as Permutation_Differences__NumPy, except that each block of subsets
+    is turned into a matrix of indicators, (1 if a value is in the first
+    group, 0 otherwise) one row per subset, which is multiplied by the matrix
+    of values to get the totals of the first group for every subset and every
+    column at once. Each batch is a NumPy matrix with one row per column.
+    
+    @matrix
+            (list<list<float>>)
+            The pooled values of both groups, one list per column. In each
+            list, the first @len_1 values belong to the first group and the
+            rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (list<bool>)
+            For each column, whether or not the first group had the larger
+            average originally.
+    @block_size
+            (int)
+            The maximum number of subsets to be processed at once.
+    
+    Permutation_Differences__Shared(list<list<float>>, int, int, list<bool>,
+            int) -> generator<numpy.ndarray<float>>
+    """
+    len_both = len_1 + len_2
+    values = numpy.array(matrix, dtype = numpy.float64).T
+    totals = values.sum(axis = 0)
+    signs = numpy.where(larger_is_1, 1.0, -1.0)
+    for indexes in Combination_Blocks(len_both, len_1, block_size):
+        indicators = numpy.zeros((len(indexes), len_both))
+        rows = numpy.arange(len(indexes))[:, numpy.newaxis]
+        indicators[rows, indexes] = 1.0
+        totals_g1 = indicators.dot(values)
+        avgs_1 = totals_g1/len_1
+        avgs_2 = (totals - totals_g1)/len_2
+        yield ((avgs_1 - avgs_2) * signs).T
+
+def Permutation_Differences__Monte_Carlo(values, len_1, len_2, larger_is_1,
+            block_size, draws, seed):
+    """
+    Generate the differences between the group averages for @draws random
+    relabellings of the pooled values, in batches of at most @block_size.
+    Relabellings are drawn with replacement, so the same relabelling may be
+    drawn more than once.
+    
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+            The differences are calculated as the average of that group minus
+            the average of the other group.
+    @block_size
+            (int)
+            The maximum number of differences in each batch.
+    @draws
+            (int)
+            The number of random relabellings to draw.
+    @seed
+            (int)
+            The seed for the random number generator.
+    
+    Permutation_Differences__Monte_Carlo(list<float>, int, int, bool, int,
+            int, int) -> generator<list<float>>
+    """
+    generator = random.Random(seed)
+    total = sum(values)
+    remaining = draws
+    while remaining:
+        size = min(remaining, block_size)
+        differences = []
+        for i in range(size):
+            total_g1 = sum(generator.sample(values, len_1))
+            avg_1 = total_g1/len_1
+            avg_2 = (total - total_g1)/len_2
+            if larger_is_1:
+                differences.append(avg_1 - avg_2)
+            else:
+                differences.append(avg_2 - avg_1)
+        remaining -= size
+        yield differences
+
+def Permutation_Differences__Monte_Carlo_NumPy(values, len_1, len_2,
+            larger_is_1, block_size, draws, seed):
+    """
+    Generate the differences between the group averages for @draws random
+    relabellings of the pooled values, in batches of at most @block_size.
+    Relabellings are drawn with replacement, so the same relabelling may be
+    drawn more than once.
+    
+    Same as Permutation_Differences__Monte_Carlo, except that each batch of
+    relabellings is drawn and evaluated at once using NumPy. Each batch is a
+    NumPy array.
+    
+    Permutation_Differences__Monte_Carlo_NumPy(list<float>, int, int, bool,
+            int, int, int) -> generator<numpy.ndarray<float>>
+    """
+    generator = numpy.random.RandomState(seed)
+    array = numpy.array(values, dtype = numpy.float64)
+    total = sum(values)
+    remaining = draws
+    while remaining:
+        size = min(remaining, block_size)
+        keys = generator.random_sample((size, len_1 + len_2))
+        indexes = keys.argpartition(len_1 - 1, axis = 1)[:, :len_1]
+        totals_g1 = array[indexes].sum(axis = 1)
+        avgs_1 = totals_g1/len_1
+        avgs_2 = (total - totals_g1)/len_2
+        remaining -= size
+        if larger_is_1:
+            yield avgs_1 - avgs_2
+        else:
+            yield avgs_2 - avgs_1
+
+def Binomial(n, k):
+    """
+    Return the number of ways of choosing @k items from @n items.
+    
+    @n
+            (int)
+            The number of items to choose from.
+    @k
+            (int)
+            The number of items chosen.
+    
+    Binomial(int, int) -> int
+    """
+    if k < 0 or k > n: return 0
+    k = min(k, n - k)
+    result = 1
+    for i in range(k):
+        result = (result * (n - i))//(i + 1)
+    return result
+
+def Unrank_Combination(length, size, rank):
+    """
+    Return the subset of size @size of the indexes 0 to (@length - 1) which
+    has the rank @rank, when all such subsets are sorted in lexicographic
+    order. (The order generated by itertools.combinations)
+    
+    @length
+            (int)
+            The number of indexes to choose from.
+    @size
+            (int)
+            The number of indexes in each subset.
+    @rank
+            (int)
+            The position of the subset, starting from 0.
+    
+    Unrank_Combination(int, int, int) -> list<int>
+    """
+    result = []
+    index = 0
+    for i in range(size):
+        remaining = size - i - 1
+        count = Binomial(length - index - 1, remaining)
+        while rank >= count:
+            rank -= count
+            index += 1
+            count = Binomial(length - index - 1, remaining)
+        result.append(index)
+        index += 1
+    return result
+
+def Lazy_Combinations(length, size, start=0, stop=None):
+    """
+    Generate the subsets of size @size of the indexes 0 to (@length - 1) in
+    lexicographic order, one at a time, starting from the subset of rank
+    @start and stopping before the subset of rank @stop.
+    
+    Nothing is generated in advance, so enumeration can be resumed from any
+    rank without generating the subsets before it.
+    
+    @length
+            (int)
+            The number of indexes to choose from.
+    @size
+            (int)
+            The number of indexes in each subset.
+    @start
+            (int)
+            The rank of the first subset to be generated.
+    @stop
+            (int) OR
+            (None)
+            The rank of the subset to stop at. (Not generated) If None, all
+            subsets from @start onwards are generated.
+    
+    Lazy_Combinations(int, int, int, int) -> generator<tuple<int>>
+    """
+    total = Binomial(length, size)
+    if stop == None or stop > total: stop = total
+    if start >= stop: return
+    # From the beginning
+    if start == 0:
+        combinations = itertools.combinations(range(length), size)
+    # From the middle
+    else:
+        first = Unrank_Combination(length, size, start)
+        combinations = Combinations_After(length, size, first)
+    for combination in itertools.islice(combinations, stop - start):
+        yield combination
+
+def Combinations_After(length, size, first):
+    """
+    Generate the subset @first and every subset of the same size which comes
+    after it in lexicographic order.
+    
+    The subsets which come after @first are those which share its first i
+    indexes and have a larger index in position i. Each group of these is
+    generated by itertools.combinations.
+    
+    @length
+            (int)
+            The number of indexes to choose from.
+    @size
+            (int)
+            The number of indexes in each subset.
+    @first
+            (list<int>)
+            The first subset to be generated.
+    
+    Combinations_After(int, int, list<int>) -> generator<tuple<int>>
+    """
+    yield tuple(first)
+    for i in range(size - 1, -1, -1):
+        prefix = tuple(first[:i])
+        size_tail = size - i - 1
+        for index in range(first[i] + 1, length - size_tail):
+            head = prefix + (index,)
+            for tail in itertools.combinations(range(index + 1, length),
+                    size_tail):
+                yield head + tail
+
+def Lazy_Relabellings(len_1, len_2, start=0, stop=None):
+    """
+    Generate every distinct assignment of group IDs to the pooled values, one
+    at a time. Each assignment is a list containing a 1 for every value in the
+    first group and a 2 for every value in the second group.
+    
+    The assignments are generated in the same order as Lazy_Combinations
+    generates the indexes of the values in the first group, and can likewise be
+    resumed from any rank.
+    
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @start
+            (int)
+            The rank of the first assignment to be generated.
+    @stop
+            (int) OR
+            (None)
+            The rank of the assignment to stop at. (Not generated) If None, all
+            assignments from @start onwards are generated.
+    
+    Lazy_Relabellings(int, int, int, int) -> generator<list<int>>
+    """
+    len_both = len_1 + len_2
+    for combination in Lazy_Combinations(len_both, len_1, start, stop):
+        assignment = [2] * len_both
+        for i in combination:
+            assignment[i] = 1
+        yield assignment
+
+def Combination_Blocks(length, size, block_size, start=0, stop=None):
+    """
+    Generate the subsets of size @size of the indexes 0 to (@length - 1) in
+    lexicographic order, as NumPy matrices with one subset per row, starting
+    from the subset of rank @start and stopping before the subset of rank
+    @stop.
+    
+    Every matrix has exactly @block_size rows, except for the last one. The
+    matrices are assembled from precomputed tables of smaller subsets, so no
+    Python-level work is done per subset.
+    
+    @length
+            (int)
+            The number of indexes to choose from.
+    @size
+            (int)
+            The number of indexes in each subset.
+    @block_size
+            (int)
+            The number of subsets in each matrix.
+    @start
+            (int)
+            The rank of the first subset to be generated.
+    @stop
+            (int) OR
+            (None)
+            The rank of the subset to stop at. (Not generated) If None, all
+            subsets from @start onwards are generated.
+    
+    Combination_Blocks(int, int, int, int, int) ->
+            generator<numpy.ndarray<int>>
+    """
+    total = Binomial(length, size)
+    if stop == None or stop > total: stop = total
+    if start >= stop: return
+    tables = {}
+    pieces = []
+    rows = 0
+    for piece in Combination_Pieces(length, size, block_size, tables, 0, [],
+            start, stop - start):
+        pieces.append(piece)
+        rows += len(piece)
+        while rows >= block_size:
+            block = numpy.vstack(pieces)
+            yield block[:block_size]
+            pieces = [block[block_size:]]
+            rows -= block_size
+    if rows:
+        yield numpy.vstack(pieces)
+
+def Combination_Pieces(length, size, block_size, tables, lowest, prefix, skip,
+            take):
+    """
+    Generate the subsets of size @size of the indexes @lowest to (@length - 1),
+    each preceded by the indexes in @prefix, in lexicographic order, as NumPy
+    matrices of varying sizes. The first @skip subsets are skipped, and only
+    @take subsets are generated.
+    
+    Helper function for Combination_Blocks. The subsets are split up by their
+    first index until there are no more than @block_size subsets in each part.
+    
+    Combination_Pieces(int, int, int, dict<(int, int):numpy.ndarray<int>>,
+            int, list<int>, int, int) -> generator<numpy.ndarray<int>>
+    """
+    if Binomial(length - lowest, size) <= block_size:
+        table = Combination_Table(length - lowest, size, tables)
+        table = table[skip:skip + take] + lowest
+        columns = numpy.empty((len(table), len(prefix)), dtype = numpy.intp)
+        columns[:] = prefix
+        yield numpy.hstack([columns, table])
+        return
+    for first in range(lowest, length - size + 1):
+        count = Binomial(length - first - 1, size - 1)
+        if skip >= count:
+            skip -= count
+            continue
+        count = min(count - skip, take)
+        for piece in Combination_Pieces(length, size - 1, block_size, tables,
+                first + 1, prefix + [first], skip, count):
+            yield piece
+        skip = 0
+        take -= count
+        if not take: return
+
+def Combination_Table(length, size, tables):
+    """
+    Return a NumPy matrix of every subset of size @size of the indexes 0 to
+    (@length - 1) in lexicographic order, one subset per row. Tables are built
+    from smaller tables and stored in @tables for reuse.
+    
+    Helper function for Combination_Blocks.
+    
+    Combination_Table(int, int, dict<(int, int):numpy.ndarray<int>>) ->
+            numpy.ndarray<int>
+    """
+    key = (length, size)
+    if key in tables: return tables[key]
+    if size == 0:
+        table = numpy.zeros((1, 0), dtype = numpy.intp)
+    else:
+        parts = []
+        for first in range(length - size + 1):
+            rest = Combination_Table(length - first - 1, size - 1, tables)
+            part = numpy.empty((len(rest), size), dtype = numpy.intp)
+            part[:, 0] = first
+            part[:, 1:] = rest + (first + 1)
+            parts.append(part)
+        table = numpy.vstack(parts)
+    tables[key] = table
+    return table
+
+def Calculate_P_Value(difference, differences, test_type, directional,
+            tolerance=0.0):
+    """
+    Calculate the p-value of a difference given a number of differences
+    generated by permutation.
+    
+    @difference
+            (float)
+            The actual difference observed.
+    @differences
+            (list<float>)
+            The differences generated by permutating the group IDs.
+    @test_type
+            (int - ENUM)
+            An integer denoting what kind of test will be performed on the data.
+            The options are as follows:
+                1 - Frequentist
+                2 - Standard Deviation
+                3 - Rank Sum
     @directional
             (bool)
             Whether or not the tests should be directional or not.
+    @tolerance
+            (float)
+            How much smaller than @difference a permutation difference can be
+            and still be counted as being at least as large. This prevents
+            rounding errors from affecting which differences are counted.
     
-    Pairwise_Analyses(<list<list>>, int, bool) -> [float, int, list<list<str>>]
+    Calculate_P_Value(float, list<float>, int, bool, float) -> float
     """
-    # Setup - results
-    results = []
+    accumulator = New_Accumulator(difference, test_type, directional,
+            tolerance)
+    if not accumulator: return "NA"
+    accumulator.Add_Batch(differences)
+    return accumulator.Get_P_Value()
+
+def New_Accumulator(difference, test_type, directional, tolerance=0.0):
+    """
+    Return a new accumulator which calculates the p-value of a difference from
+    the permutation differences fed to it, without storing them.
     
-    # Setup - reading
-    length = len(data[0])
-    length_ = length - 2
-    range_ = range(length_)
-    exp_ID = data[0][0]
+    @difference
+            (float)
+            The actual difference observed.
+    @test_type
+            (int - ENUM)
+            An integer denoting what kind of test will be performed on the data.
+            The options are as follows:
+                1 - Frequentist
+                2 - Standard Deviation
+                3 - Rank Sum
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    @tolerance
+            (float)
+            How much smaller than @difference a permutation difference can be
+            and still be counted as being at least as large. (Frequentist tests
+            only)
     
-    group_IDs = []
-    for row in data:
-        group_ID = row[1]
-        group_IDs.append(group_ID)
-    group_IDs = list(group_IDs)
-    group_IDs = sorted(group_IDs)
+    New_Accumulator(float, int, bool, float) -> Frequentist_Accumulator
+    New_Accumulator(float, int, bool, float) -> SDev_Accumulator
+    New_Accumulator(float, int, bool, float) -> None
+    """
+    if test_type == TEST.FREQ:
+        return Frequentist_Accumulator(difference, directional, tolerance)
+    elif test_type == TEST.SDEV:
+        return SDev_Accumulator(difference, directional)
+    return None
+
+def Calculate_P_Value__SD(difference, sd, directional):
+    """
+    Calculate the p-value of a difference given the standard deviation of the
+    differences generated by permutation.
     
-    # Setup - metrics
-    total_score = 0.0
-    total_tests = 0
+    @difference
+            (float)
+            The actual difference observed.
+    @sd
+            (float)
+            The population standard deviation of the differences generated by
+            permutating the group IDs.
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    
+    Calculate_P_Value__SD(float, float, bool) -> float
+    """
+    z_score = difference/sd
+    if directional:
+        p = Flexible_Z_Test(z_score)
+    else:
+        p = Flexible_Z_Test(z_score) * 2
+    return p
+
+def Calculate_SD__Analytic(values, len_1, len_2):
+    """
+    Calculate the population standard deviation of the differences between the
+    group averages across every possible relabelling, directly from the pooled
+    values and without generating any of the relabellings.
+    
+    The total of the first group is the total of a sample drawn without
+    replacement from the pooled values, which has a variance of:
+        len_1 * len_2 * variance / (len_both - 1)
+    
+    The difference between the averages is that total multiplied by
+    (len_both / (len_1 * len_2)), minus a constant. The average difference is
+    always 0.
+    
+    @values
+            (list<float>)
+            The pooled values of both groups.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    
+    Calculate_SD__Analytic(list<float>, int, int) -> float
+    """
+    len_both = len_1 + len_2
+    mean = sum(values)/len_both
+    total = 0
+    for value in values:
+        total += (value - mean) ** 2
+    variance = total/len_both
+    variance = (variance * len_both * len_both)/(len_1 * len_2 * (len_both - 1))
+    return variance ** 0.5
+
+def Calculate_P_Value__Edgeworth(values, len_1, len_2, larger_is_1,
+            difference, tolerance=0.0):
+    """
+    Approximate the p-value of a Frequentist test, (The proportion of all
+    possible relabellings with a difference at least as large as the original)
+    directly from the pooled values, without generating any relabellings.
+    
+    The difference between the averages only depends on the total of the
+    group with the larger average, which is the total of a sample drawn
+    without replacement from the pooled values. The first four cumulants of
+    that total are calculated exactly from the power sums of the pooled
+    values, (Centered on their average) where a(k) is the probability of k
+    particular values all being in the sample:
+        E[X^2] = P2 * (a1 - a2)
+        E[X^3] = P3 * (a1 - 3*a2 + 2*a3)
+        E[X^4] = P4 * (a1 - 7*a2 + 12*a3 - 6*a4) + P2^2 * (3*a2 - 6*a3 + 3*a4)
+    The tail probability is then approximated by the Edgeworth expansion,
+    which corrects the normal distribution for the skewness and kurtosis of
+    the totals.
+    
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+    @difference
+            (float)
+            The actual difference observed.
+    @tolerance
+            (float)
+            How much smaller than @difference a permutation difference can be
+            and still be counted as being at least as large.
+    
+    Calculate_P_Value__Edgeworth(list<float>, int, int, bool, float, float)
+            -> float
+    """
+    len_both = len_1 + len_2
+    if larger_is_1:
+        size = len_1
+        len_other = len_2
+    else:
+        size = len_2
+        len_other = len_1
+    # Power sums of the centered values
+    mean = sum(values)/len_both
+    p2 = 0.0
+    p3 = 0.0
+    p4 = 0.0
+    for value in values:
+        centered = value - mean
+        p2 += centered ** 2
+        p3 += centered ** 3
+        p4 += centered ** 4
+    # Probabilities of k particular values all being in the sample
+    a = [1.0]
+    for k in range(4):
+        if size > k: a.append((a[-1] * (size - k))/(len_both - k))
+        else: a.append(0.0) # Fewer than k values in the sample
+    # Cumulants of the total of the sample
+    k2 = p2 * (a[1] - a[2])
+    if not k2 > 0: return 1.0
+    k3 = p3 * (a[1] - (3 * a[2]) + (2 * a[3]))
+    m4 = ((p4 * (a[1] - (7 * a[2]) + (12 * a[3]) - (6 * a[4]))) +
+            ((p2 ** 2) * ((3 * a[2]) - (6 * a[3]) + (3 * a[4]))))
+    k4 = m4 - (3 * (k2 ** 2))
+    skew = k3/(k2 ** 1.5)
+    kurtosis = k4/(k2 ** 2)
+    # Threshold for the total, as a z-score
+    scale = (1.0/size) + (1.0/len_other)
+    total = sum(values)
+    threshold = (difference - tolerance + (total/len_other))/scale
+    z = (threshold - (size * mean))/(k2 ** 0.5)
+    # Edgeworth expansion
+    density = math.exp(-(z ** 2)/2)/((2 * math.pi) ** 0.5)
+    correction = (((skew/6) * ((z ** 2) - 1)) +
+            ((kurtosis/24) * ((z ** 3) - (3 * z))) +
+            (((skew ** 2)/72) * ((z ** 5) - (10 * (z ** 3)) + (15 * z))))
+    p_value = Flexible_Z_Test(z) + (density * correction)
+    return min(max(float(p_value), 0.0), 1.0)
+
+def Rank_Sum_Test(values_1, values_2, directional, cache=None):
+    """
+    Perform a rank sum permutation test between two groups of values, and
+    return the p-value along with a description of how it was obtained, in the
+    same format as Permutation_Test.
+    
+    The values are replaced with their ranks, with tied values sharing the
+    average of their ranks. The ranks are doubled so that they are always
+    whole numbers. The number of relabellings giving each possible rank sum
+    for the smaller group is then counted exactly:
+        - If there are no ties, this only depends on the sizes of the groups,
+          and is calculated by Rank_Sum_Table.
+        - If there are ties, this is calculated by Count_Subset_Sums.
+    The counts are kept in @cache, if there is one, so that they are only
+    calculated once. If the counts would take too much memory, a normal
+    approximation is used instead.
+    
+    For directional tests, the p-value is the proportion of relabellings where
+    the rank sum of the group with the higher average rank is at least as high
+    as the original. For non-directional tests, it is the proportion of
+    relabellings where the rank sum is at least as far from its average.
+    
+    @values_1
+            (list<float>)
+            The values of the first group.
+    @values_2
+            (list<float>)
+            The values of the second group.
+    @directional
+            (bool)
+            Whether or not the tests should be directional or not.
+    @cache
+            (Null_Cache) OR
+            (None)
+            Where the counts of previous comparisons are kept.
+    
+    Rank_Sum_Test(list<float>, list<float>, bool, Null_Cache) ->
+            [float, float, int, int, bool]
+    """
+    len_1 = len(values_1)
+    len_2 = len(values_2)
+    len_both = len_1 + len_2
+    ranks = Get_Doubled_Ranks(values_1 + values_2)
+    sum_1 = sum(ranks[:len_1])
+    sum_2 = sum(ranks[len_1:])
+    larger_is_1 = (sum_1 * len_2) > (sum_2 * len_1)
+    # Count relabellings of the smaller group
+    if len_1 <= len_2:
+        size = len_1
+        original = sum_1
+        larger = larger_is_1
+    else:
+        size = len_2
+        original = sum_2
+        larger = not larger_is_1
+    average = size * (len_both + 1)
+    total = Binomial(len_both, size)
+    
+    # Counts of each possible rank sum
+    ties = len(set(ranks)) < len_both
+    if ties:
+        key = (TEST.RANK, tuple(sorted(ranks)), size)
+        cells = (size + 1) * (sum(ranks) + 1)
+    else:
+        key = (TEST.RANK, size, len_both - size)
+        cells = (size + 1) * ((size * (len_both - size)) + 1)
+    counts = None
+    if cache != None:
+        counts = cache.Get(key)
+    if counts == None and cells <= MAX_DP_CELLS:
+        if ties:
+            counts = Count_Subset_Sums(ranks, size)
+        else:
+            # Rank sums are offset from the table, which starts at the lowest
+            offset = size * (size + 1)
+            counts = [0] * offset
+            for count in Rank_Sum_Table(size, len_both - size):
+                counts += [count, 0]
+        if cache != None and counts != None: cache.Put(key, counts)
+    
+    # Too large to count
+    if counts == None:
+        mean = float(sum(ranks))/len_both
+        squares = 0.0
+        for rank in ranks:
+            squares += (rank - mean) ** 2
+        variance = (squares * size * (len_both - size))/(len_both *
+                (len_both - 1))
+        if not variance:
+            return [1.0, 0.0, METHOD.ANALYTIC, 0, larger_is_1]
+        p_value = Calculate_P_Value__SD(abs(original - average),
+                variance ** 0.5, directional)
+        return [min(p_value, 1.0), 0.0, METHOD.ANALYTIC, 0, larger_is_1]
+    
+    # Count
+    count = 0
+    if directional:
+        if larger:
+            count = sum(counts[original:])
+        else:
+            count = sum(counts[:original + 1])
+    else:
+        distance = abs(original - average)
+        for rank_sum in range(len(counts)):
+            if abs(rank_sum - average) >= distance:
+                count += counts[rank_sum]
+    p_value = float(count)/total
+    return [p_value, 0.0, METHOD.EXHAUSTIVE, total, larger_is_1]
+
+def Get_Doubled_Ranks(values):
+    """
+    Return the ranks of @values, starting from 1, multiplied by 2. Tied values
+    share the average of their ranks. Doubling the ranks ensures that they are
+    always whole numbers.
+    
+    @values
+            (list<float>)
+            The values to be ranked.
+    
+    Get_Doubled_Ranks(list<float>) -> list<int>
+    """
+    order = sorted(range(len(values)), key = lambda i: values[i])
+    ranks = [0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and (values[order[end + 1]] ==
+                values[order[start]]):
+            end += 1
+        # Positions start to end share the ranks (start + 1) to (end + 1)
+        for i in order[start:end + 1]:
+            ranks[i] = start + end + 2
+        start = end + 1
+    return ranks
+
+def Rank_Sum_Table(len_1, len_2):
+    """
+    Return a list of how many ways of splitting the ranks 1 to (@len_1 +
+    @len_2) into two groups of @len_1 and @len_2 ranks give each possible
+    Mann-Whitney U statistic for the first group, from 0 to (@len_1 * @len_2).
+    The U statistic is the rank sum of the first group minus its lowest
+    possible value.
+    
+    The counts are the coefficients of the Gaussian binomial coefficient,
+    which are built up one rank of the first group at a time:
+        table(i) = table(i - 1) * (1 - q^(@len_2 + i))/(1 - q^i)
+    
+    @len_1
+            (int)
+            The number of ranks in the first group.
+    @len_2
+            (int)
+            The number of ranks in the second group.
+    
+    Rank_Sum_Table(int, int) -> list<int>
+    """
+    length = (len_1 * len_2) + 1
+    table = [1] + [0] * (length - 1)
+    for i in range(1, len_1 + 1):
+        # Multiply by (1 - q^(len_2 + i))
+        step = len_2 + i
+        for u in range(length - 1, step - 1, -1):
+            table[u] -= table[u - step]
+        # Divide by (1 - q^i)
+        for u in range(i, length):
+            table[u] += table[u - i]
+    return table
+
+def Count_Relabellings__Dynamic(values, len_1, len_2, larger_is_1,
+            resolution=None):
+    """
+    Count how many ways of splitting the pooled values into two groups of the
+    original sizes give a difference between the group averages at least as
+    large as the original, without generating any of them. Return the count
+    and the total number of ways, or None if the values are not multiples of
+    @resolution, or if the table needed would be too large.
+    
+    The values are converted into whole numbers of @resolution. The difference
+    between the averages only depends on the total of the first group, so it
+    is enough to know how many subsets of the pooled values give each possible
+    total. (Subset-sum dynamic programming) The subsets of the smaller group
+    are counted, since there are as many of them as there are of the larger
+    group.
+    
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
+    @resolution
+            (float) OR
+            (None)
+            The smallest possible difference between two values. If None, the
+            resolution is detected.
+    
+    Count_Relabellings__Dynamic(list<float>, int, int, bool, float) ->
+            [int, int]
+    Count_Relabellings__Dynamic(list<float>, int, int, bool, float) -> None
+    """
+    units = Get_Units(values, resolution)
+    if not units: return None
+    # Count subsets of the smaller group
+    if len_1 <= len_2:
+        size = len_1
+        original = sum(units[:len_1])
+        larger = larger_is_1
+    else:
+        size = len_2
+        original = sum(units[len_1:])
+        larger = not larger_is_1
+    # Shift the units so that the smallest is 0
+    lowest = min(units)
+    units = [unit - lowest for unit in units]
+    original -= lowest * size
+    if (size + 1) * (sum(units) + 1) > MAX_DP_CELLS: return None
+    counts = Count_Subset_Sums(units, size)
+    if counts == None: return None
+    # The difference rises with the total of the group with the larger average
+    if larger:
+        count = sum(counts[original:])
+    else:
+        count = sum(counts[:original + 1])
+    return [int(count), Binomial(len_1 + len_2, len_1)]
+
+def Get_Units(values, resolution=None):
+    """
+    Return the values as whole numbers of @resolution, or None if any of the
+    values are not a multiple of @resolution.
     
-    # Subsets
-    subsets = {}
-    for group_ID in group_IDs:
-        temp = []
-        for i in range_:
-            temp.append([]) # Necessary to ensure hardcopying
-        subsets[group_ID] = temp
-    for row in data:
-        group_ID = row[1]
-        for i in range(2, length):
-            value = row[i]
-            if value:
-                subsets[group_ID][i-2].append(value)
-    # Pairs
-    pairs = Get_All_Pairs(group_IDs)
+    If @resolution is None, the resolutions 1, 0.1, 0.01, etc. are tried, up to
+    MAX_DECIMALS decimal places.
     
-    for pair in pairs:
-        # Unpack
-        g1, g2 = pair
-        
-        # Setup
-        row_result = [exp_ID, g1, g2]
-        
-        # All columns
-        for i in range_:
-            
-            # From subset
-            values_1 = subsets[g1][i]
-            values_2 = subsets[g2][i]
-            len_1 = len(values_1)
-            len_2 = len(values_2)
-            
-            # Original
-            avg_1 = sum(values_1)/len_1
-            avg_2 = sum(values_2)/len_2
-            if avg_1 > avg_2:
-                larger = g1
-                smaller = g2
-                difference = avg_1 - avg_2
-            else:
-                larger = g2
-                smaller = g1
-                difference = avg_2 - avg_1
-            
-            # Setup permutations
-            values = values_1 + values_2
-            IDs = ([g1] * len_1) + ([g2] * len_2)
-            permutations = Simple_Permutate(IDs)
-            len_both = len_1 + len_2
-            range_both = range(len_both)
-            
-            # Calculate all differences
-            differences = []
-            for permutation in permutations:
-                total_g1 = 0
-                total_g2 = 0
-                for i in range_both:
-                    value = values[i]
-                    ID = permutation[i]
-                    if ID == g1:
-                        total_g1 += value
-                    else:
-                        total_g2 += value
-                avg_1 = total_g1/len_1
-                avg_2 = total_g2/len_2
-                if larger == g1:
-                    permutation_dif = avg_1 - avg_2
-                else:
-                    permutation_dif = avg_2 - avg_1
-                differences.append(permutation_dif)
+    @values
+            (list<float>)
+            The values to be converted.
+    @resolution
+            (float) OR
+            (None)
+            The smallest possible difference between two values.
+    
+    Get_Units(list<float>, float) -> list<int>
+    Get_Units(list<float>, float) -> None
+    """
+    if resolution == None:
+        for decimals in range(MAX_DECIMALS + 1):
+            units = Get_Units(values, 10.0 ** -decimals)
+            if units: return units
+        return None
+    units = []
+    for value in values:
+        unit = int(round(value/resolution))
+        if abs((value/resolution) - unit) > 1e-6: return None
+        units.append(unit)
+    return units
 
-            # Calculate p-value
-            p_value = Calculate_P_Value(difference, differences, test_type,
-                    directional)
-            total_score += p_value
-            total_tests += 1
-            
-            # Stringbuilding
-            row_result.append(str(p_value))
-            row_result.append(larger)
-            
-        results.append(row_result)
+def Count_Subset_Sums(units, size):
+    """
+    Return a list of how many subsets of size @size of @units give each
+    possible total, from 0 to the total of all @units, or None if the counts
+    could exceed 64 bits.
     
-    # Return
-    return [total_score, total_tests, results]
+    Each unit is added in turn, and every subset which does not contain it is
+    extended by it. Uses NumPy to process all the subset sizes and totals at
+    once if it is available.
+    
+    @units
+            (list<int>)
+            The values, as non-negative whole numbers.
+    @size
+            (int)
+            The number of values in each subset.
+    
+    Count_Subset_Sums(list<int>, int) -> list<int>
+    Count_Subset_Sums(list<int>, int) -> None
+    """
+    length = len(units)
+    maximum = sum(units)
+    if Binomial(length, size) >= 2 ** 63: return None
+    if not CRUDE_Z_TEST:
+        table = numpy.zeros((size + 1, maximum + 1), dtype = numpy.int64)
+        table[0, 0] = 1
+        for unit in units:
+            # Overlapping slices are buffered, so each unit is used once
+            table[1:, unit:] += table[:-1, :maximum + 1 - unit]
+        return table[size].tolist()
+    table = [[0] * (maximum + 1) for k in range(size + 1)]
+    table[0][0] = 1
+    highest = 0
+    for i in range(length):
+        unit = units[i]
+        # Only subsets which can still grow to the full size are needed
+        lowest = max(1, size - (length - i) + 1)
+        for k in range(min(i + 1, size), lowest - 1, -1):
+            previous = table[k - 1]
+            current = table[k]
+            for total in range(highest + 1):
+                if previous[total]:
+                    current[total + unit] += previous[total]
+        highest += unit
+    return table[size]
 
-def Calculate_P_Value(difference, differences, test_type, directional):
+def Count_Relabellings__Middle(values, len_1, len_2, larger_is_1, difference,
+            tolerance=0.0):
     """
-    Calculate the p-value of a difference given a number of differences
-    generated by permutation.
+    Count how many ways of splitting the pooled values into two groups of the
+    original sizes give a difference between the group averages at least as
+    large as the original, without generating any of them. Return the count
+    and the total number of ways, or None if there are too many values.
+    
+    The pooled values are split into two halves, and the totals of every
+    subset of each half are listed, by subset size. A subset of the smaller
+    group is made up of a subset of the first half and a subset of the second
+    half. For every total from the first half, the number of totals from the
+    second half which bring it past the threshold is found by searching the
+    sorted totals. (Meet in the middle)
     
+    @values
+            (list<float>)
+            The pooled values of both groups. The first @len_1 values belong to
+            the first group and the rest belong to the second group.
+    @len_1
+            (int)
+            The number of values in the first group.
+    @len_2
+            (int)
+            The number of values in the second group.
+    @larger_is_1
+            (bool)
+            Whether or not the first group had the larger average originally.
     @difference
             (float)
             The actual difference observed.
-    @differences
-            (list<float>)
-            The differences generated by permutating the group IDs.
-    @test_type
-            (int - ENUM)
-            An integer denoting what kind of test will be performed on the data.
-            The options are as follows:
-                1 - Frequentist
-                2 - Standard Deviation
-    @directional
-            (bool)
-            Whether or not the tests should be directional or not.
+    @tolerance
+            (float)
+            How much smaller than @difference a permutation difference can be
+            and still be counted as being at least as large.
     
-    Calculate_P_Value(float, list<float>, int) -> str
+    Count_Relabellings__Middle(list<float>, int, int, bool, float, float) ->
+            [int, int]
+    Count_Relabellings__Middle(list<float>, int, int, bool, float, float) ->
+            None
     """
-    length = len(differences)
-    if test_type == TEST.FREQ:
-        count = 0
-        for i in differences:
-            if directional:
-                if i >= difference:
-                    count += 1
+    len_both = len_1 + len_2
+    half = len_both//2
+    if 2 ** (len_both - half) > MAX_MITM_SUBSETS: return None
+    # Count subsets of the smaller group
+    if len_1 <= len_2:
+        size = len_1
+        len_other = len_2
+        larger = larger_is_1
+    else:
+        size = len_2
+        len_other = len_1
+        larger = not larger_is_1
+    # Convert the threshold for the difference into one for the total
+    total = sum(values)
+    scale = (1.0/size) + (1.0/len_other)
+    if larger:
+        threshold = (difference - tolerance + (total/len_other))/scale
+    else:
+        threshold = ((total/len_other) - difference + tolerance)/scale
+    # Subset totals of each half
+    sums_left = Subset_Sums_By_Size(values[:half], size)
+    sums_right = Subset_Sums_By_Size(values[half:], size)
+    # Count
+    count = 0
+    for size_left in range(len(sums_left)):
+        size_right = size - size_left
+        if size_right >= len(sums_right): continue
+        left = sums_left[size_left]
+        right = sums_right[size_right]
+        if not CRUDE_Z_TEST:
+            right = numpy.sort(right)
+            targets = threshold - left
+            if larger:
+                found = len(right) - right.searchsorted(targets, "left")
             else:
-                if i >= abs(difference):
-                    count += 1
-        p = float(count)/length
-        return p
-    elif test_type == TEST.SDEV:
-        mean = sum(differences)/length
-        total = 0
-        for i in differences:
-            x = (i - mean) ** 2
-            total += x
-        sd = (total/length) ** 0.5
-        z_score = difference/sd
-        if directional:
-            p = Flexible_Z_Test(z_score)
+                found = right.searchsorted(targets, "right")
+            count += int(found.sum())
         else:
-            p = Flexible_Z_Test(z_score) * 2
-        return p
-    return "NA"
+            right = sorted(right)
+            for sum_left in left:
+                target = threshold - sum_left
+                if larger:
+                    count += len(right) - bisect.bisect_left(right, target)
+                else:
+                    count += bisect.bisect_right(right, target)
+    return [count, Binomial(len_both, len_1)]
+
+def Subset_Sums_By_Size(values, size):
+    """
+    Return the totals of every subset of @values with no more than @size
+    values, as a list of arrays. The nth array contains the totals of every
+    subset of n values. The arrays are NumPy arrays if NumPy is available, and
+    arrays of doubles otherwise, which use far less memory than lists.
+    
+    @values
+            (list<float>)
+            The values.
+    @size
+            (int)
+            The largest number of values in a subset.
+    
+    Subset_Sums_By_Size(list<float>, int) -> list<numpy.ndarray<float>>
+    Subset_Sums_By_Size(list<float>, int) -> list<array<float>>
+    """
+    size = min(size, len(values))
+    if not CRUDE_Z_TEST:
+        sums = [numpy.zeros(1)] + [numpy.zeros(0) for k in range(size)]
+        for value in values:
+            for k in range(size, 0, -1):
+                sums[k] = numpy.concatenate([sums[k], sums[k - 1] + value])
+        return sums
+    sums = [array.array("d", [0.0])] + [array.array("d") for k in
+            range(size)]
+    for value in values:
+        for k in range(size, 0, -1):
+            sums[k].extend(array.array("d", [sum_ + value for sum_ in
+                    sums[k - 1]]))
+    return sums
 
 def Flexible_Z_Test(z_score):
     """
@@ -650,7 +4857,8 @@ def Flexible_Z_Test(z_score):
     else:
         return scipy.stats.norm.sf(z_score)
 
-def Build_Header_String(list_, col_exp, col_grp, col_data, col_keep, delim):
+def Build_Header_String(list_, col_exp, col_grp, col_data, col_keep, delim,
+            width=2):
     """
     Build an output string for the header, according to the values and indexes
     given.
@@ -675,6 +4883,10 @@ def Build_Header_String(list_, col_exp, col_grp, col_data, col_keep, delim):
     @delim
             (str)
             The delimiter used to separate the values.
+    @width
+            (int)
+            The number of output columns taken up by the result for each column
+            of data.
     
     Build_String(list<str>, list<int>, str) -> str
     """
@@ -685,9 +4897,342 @@ def Build_Header_String(list_, col_exp, col_grp, col_data, col_keep, delim):
     for i in col_keep:
         headers_keep.append(list_[i])
     result = (list_[col_exp] + delim + list_[col_grp] + delim +
-            (2*delim).join(headers_data) + delim + delim.join(headers_keep))
+            (width*delim).join(headers_data) + delim + delim.join(headers_keep))
     return result
 
+def Format_Rows(rows, width, delim, annotations):
+    """
+    Return the rows of results of an experiment, as returned by
+    Pairwise_Analyses, as the text to be output, with one line per row. The
+    annotations are added to the end of every line. Missing results are
+    written as "NA".
+    
+    @rows
+            (list<list>)
+            The rows of results.
+    @width
+            (int)
+            The number of values in each result. (2 or 5)
+    @delim
+            (str)
+            The delimiter used to separate the values.
+    @annotations
+            (str)
+            The extra information to be kept, already joined by @delim.
+    
+    Format_Rows(list<list>, int, str, str) -> str
+    """
+    lines = []
+    for row in rows:
+        values = row[:3]
+        for i in range(3, len(row), width):
+            p_value = row[i]
+            if p_value == None:
+                values.append("NA")
+                if width == 5:
+                    values += ["NA", "NA", str(row[i + 3])]
+                values.append("NA")
+                continue
+            values.append(str(p_value))
+            if width == 5:
+                values.append(str(row[i + 1]))
+                values.append(DICT__method_names[row[i + 2]])
+                values.append(str(row[i + 3]))
+            values.append(row[i + width - 1])
+        values.append(annotations)
+        lines.append(delim.join(values))
+    return "\n".join(lines)
+
+def Get_Binary_Record(columns, width):
+    """
+    Return the struct for one record of a binary results file.
+    
+    @columns
+            (int)
+            The number of data columns.
+    @width
+            (int)
+            The number of values in each result. (2 or 5)
+    
+    Get_Binary_Record(int, int) -> struct.Struct
+    """
+    if width == 5: result = "ddBQB"
+    else: result = "dB"
+    return struct.Struct("<III" + (result * columns))
+
+def Convert_Binary_Results(path_in, path_out):
+    """
+    Convert a binary results file, written by Binary_Results_Writer, into the
+    same TSV which would have been written without the binary option.
+    
+    @path_in
+            (str)
+            The filepath of the binary results file.
+    @path_out
+            (str) OR
+            (None)
+            The filepath of the output file. If None, the TSV is printed.
+    
+    Convert_Binary_Results(str, str) -> int
+    
+    Return 0 if the conversion was successful, and 1 if the binary results file
+    could not be read.
+    """
+    # Header and footer
+    try:
+        f = open(path_in, "rb")
+        magic, version, width, columns = struct.unpack("<4sBBI", f.read(10))
+        if magic != STR__binary_magic or version != BINARY_VERSION:
+            raise ValueError
+        start = f.tell()
+        f.seek(-8, 2)
+        position = struct.unpack("<Q", f.read(8))[0]
+        f.seek(position)
+        delim, header, exp_IDs, group_IDs, annotations, large = pickle.load(f)
+    except:
+        PRINT.printE(STR__binary_read.format(f = path_in))
+        return 1
+    record = Get_Binary_Record(columns, width)
+    total = (position - start)//record.size
+    if path_out: o = open(path_out, "w", OUTPUT_BUFFER_SIZE)
+    else: o = None
+    if header != None:
+        Controlled_Output(header, o)
+    # Records
+    f.seek(start)
+    index = 0
+    while index < total:
+        count = min(BINARY_CHUNK, total - index)
+        data = f.read(count * record.size)
+        rows = []
+        exp_index = None
+        for i in range(count):
+            fields = record.unpack_from(data, i * record.size)
+            if fields[0] != exp_index:
+                if rows:
+                    Controlled_Output(Format_Rows(rows, width, delim,
+                            annotations[exp_index]), o)
+                rows = []
+                exp_index = fields[0]
+            g1 = group_IDs[fields[1]]
+            g2 = group_IDs[fields[2]]
+            row = [exp_IDs[exp_index], g1, g2]
+            for j in range(columns):
+                result = list(fields[3 + j*width:3 + (j + 1)*width])
+                larger = result[-1]
+                if larger == 0:
+                    result[-1] = None
+                    result[0] = None
+                elif larger == 1: result[-1] = g1
+                else: result[-1] = g2
+                if width == 5:
+                    if larger == 0:
+                        result[1] = None
+                        result[2] = None
+                    if (index + i, j) in large:
+                        result[3] = large[(index + i, j)]
+                row += result
+            rows.append(row)
+        if rows:
+            Controlled_Output(Format_Rows(rows, width, delim,
+                    annotations[exp_index]), o)
+        index += count
+    f.close()
+    if path_out: o.close()
+    return 0
+
+def Merge_Shard_Outputs(path_out, paths):
+    """
+    Combine the output files of every shard of a run, and their summaries, into
+    the output file which would have been written by an unsharded run, and
+    report the combined metrics. Binary output files are converted first.
+    
+    @path_out
+            (str) OR
+            (None)
+            The filepath of the output file. If None, the TSV is printed.
+    @paths
+            (list<str>)
+            The filepaths of the output files of the shards, in any order.
+    
+    Merge_Shard_Outputs(str, list<str>) -> int
+    
+    Return 0 if the merge was successful, and 1 if the shard output files could
+    not be read, or are not all the shards of one run.
+    """
+    # Summaries
+    summaries = []
+    for path in paths:
+        summary = Load_Pickle(path + STR__shard_suffix)
+        if not summary or not os.path.exists(path):
+            PRINT.printE(STR__merge_read.format(f = path))
+            return 1
+        summaries.append(summary)
+    shards = sorted([summary[0] for summary in summaries])
+    count = shards[0][1]
+    if shards != [[i + 1, count] for i in range(count)]:
+        PRINT.printE(STR__merge_shards)
+        return 1
+    # Open shard outputs
+    files = []
+    paths_temp = []
+    for path in paths:
+        f = open(path, "rb")
+        binary = (f.read(len(STR__binary_magic)) == STR__binary_magic)
+        f.close()
+        if binary:
+            path_temp = path + STR__temp_suffix
+            paths_temp.append(path_temp)
+            if Convert_Binary_Results(path, path_temp): break
+            path = path_temp
+        files.append(open(path, "r"))
+    # Merge
+    if len(files) == len(paths):
+        if path_out: o = open(path_out, "w", OUTPUT_BUFFER_SIZE)
+        else: o = None
+        if summaries[0][1]: # Header
+            header = files[0].readline()
+            for f in files[1:]:
+                f.readline()
+            Controlled_Output(header[:-1], o)
+        order = []
+        for i in range(len(summaries)):
+            for position, rows in zip(summaries[i][3], summaries[i][4]):
+                order.append([position, i, rows])
+        order.sort()
+        for position, i, rows in order:
+            if not rows: continue
+            sb = "".join([files[i].readline() for j in range(rows)])
+            Controlled_Output(sb[:-1], o)
+        if path_out: o.close()
+    # Clean up
+    for f in files:
+        f.close()
+    for path_temp in paths_temp:
+        if os.path.exists(path_temp):
+            os.remove(path_temp)
+    if len(files) < len(paths): return 1
+    # Metrics
+    metrics = list(summaries[0][2])
+    for summary in summaries[1:]:
+        for i in range(len(metrics)):
+            if i != 5: metrics[i] += summary[2][i] # Not the number of columns
+    Report_Metrics(metrics)
+    return 0
+
+def Save_Pickle(path, contents):
+    """
+    Pickle @contents into a file. The pickle is first written to a temporary
+    file, which then replaces the file, so that an interruption never leaves a
+    partly written file.
+    
+    @path
+            (str)
+            The filepath of the file.
+    @contents
+            (list)
+            The contents to be pickled.
+    
+    Save_Pickle(str, list) -> None
+    """
+    path_temp = path + STR__temp_suffix
+    f = open(path_temp, "wb")
+    pickle.dump(contents, f, 2)
+    Sync_File(f)
+    f.close()
+    Replace_File(path_temp, path)
+
+def Replace_File(path_new, path):
+    """
+    Replace the file at @path with the file at @path_new, in a single step
+    where possible.
+    
+    @path_new
+            (str)
+            The filepath of the new file.
+    @path
+            (str)
+            The filepath of the file to be replaced.
+    
+    Replace_File(str, str) -> None
+    """
+    if hasattr(os, "replace"):
+        os.replace(path_new, path)
+    else:
+        if os.name == "nt" and os.path.exists(path):
+            os.remove(path)
+        os.rename(path_new, path)
+
+def Load_Pickle(path):
+    """
+    Return the contents of a file written by Save_Pickle, or None if it cannot
+    be read.
+    
+    @path
+            (str)
+            The filepath of the file.
+    
+    Load_Pickle(str) -> list
+    """
+    try:
+        f = open(path, "rb")
+        contents = pickle.load(f)
+        f.close()
+    except:
+        return None
+    return contents
+
+def Sync_File(file_):
+    """
+    Write everything written to an open file so far to disk, and return the
+    position at the end of it.
+    
+    @file_
+            (file)
+            The open file.
+    
+    Sync_File(file) -> int
+    """
+    file_.flush()
+    os.fsync(file_.fileno())
+    return file_.tell()
+
+def Reopen_File(path, mode, offset):
+    """
+    Open an existing file to continue writing to it from @offset, discarding
+    everything after @offset.
+    
+    @path
+            (str)
+            The filepath of the file.
+    @mode
+            (str)
+            The mode to open the file in. ("r+" or "r+b")
+    @offset
+            (int)
+            The position to continue writing from, as returned by Sync_File.
+    
+    Reopen_File(str, str, int) -> file
+    """
+    f = open(path, mode, OUTPUT_BUFFER_SIZE)
+    f.seek(offset)
+    f.truncate()
+    return f
+
+def Decode(data):
+    """
+    Return @data, as read from a file opened in binary mode, as a string.
+    
+    @data
+            (str) OR
+            (bytes)
+            The data read. (A str in Python 2, and bytes in Python 3)
+    
+    Decode(bytes) -> str
+    """
+    if type(data) == str: return data
+    return data.decode("utf-8")
+
 def Build_String(list_, indexes, delim):
     """
     Build an output string from the values in @list_, according to the indexes
@@ -725,8 +5270,14 @@ def Report_Metrics(metrics):
                 (int)   - The number of groups
                 (int)   - The number of rows of data
                 (int)   - The number of columns of data
+                (int)   - The number of tests planned
+                (int)   - The number of tests performed
+                (int)   - The number of results reused from the cache
+                (int)   - The number of results not found in the cache
+                (int)   - The number of experiments reused from the results
+                          store
     
-    Report_Metrics(list<X>(6)) -> None
+    Report_Metrics(list<X>(11)) -> None
     """
     # Unpacking
     total = metrics[0]
@@ -735,11 +5286,16 @@ def Report_Metrics(metrics):
     grps = metrics[3]
     rows = metrics[4]
     cols = metrics[5]
+    planned = metrics[6]
+    executed = metrics[7]
+    hits = metrics[8]
+    misses = metrics[9]
+    reused = metrics[10]
     # Calculations
-    avg_score = (total)/tests
-    avg_grps_per_exp = float(grps)/exps
-    avg_rows_per_exp = float(rows)/exps
-    avg_rows_per_grp = float(rows)/grps
+    avg_score = (total)/max(tests, 1) # Shards may have no experiments
+    avg_grps_per_exp = float(grps)/max(exps, 1)
+    avg_rows_per_exp = float(rows)/max(exps, 1)
+    avg_rows_per_grp = float(rows)/max(grps, 1)
     # Strings
     avg_score = str(avg_score)
     avg_grps_per_exp = str(avg_grps_per_exp)
@@ -755,16 +5311,23 @@ def Report_Metrics(metrics):
     grps = str(grps) + "   "
     rows = str(rows) + "   "
     cols = str(cols) + "   "
+    planned = str(planned) + "   "
+    executed = str(executed) + "   "
+    hits = str(hits) + "   "
+    misses = str(misses) + "   "
+    reused = str(reused) + "   "
     # Repacking
     metrics = [avg_score, exps, grps, rows, cols, avg_grps_per_exp,
-            avg_rows_per_exp, avg_rows_per_grp]
+            avg_rows_per_exp, avg_rows_per_grp, planned, executed, hits, misses,
+            reused]
     # Pad all
     max_size = Get_Max_Len(metrics)
     metrics = Pad_Column(metrics, 0, 0, " ", 0)
     # Print
     PRINT.printM(STR__metrics.format(A = metrics[0], B = metrics[1],
             C = metrics[2], D = metrics[3], E = metrics[4], F = metrics[5],
-            G = metrics[6], H = metrics[7]))
+            G = metrics[6], H = metrics[7], I = metrics[8], J = metrics[9],
+            K = metrics[10], L = metrics[11], M = metrics[12]))
 
 def Controlled_Output(string, output_file):
     """
@@ -812,6 +5375,24 @@ def Parse_Command_Line_Input__Pairwise_Permutation_Test(raw_command_line_input):
         print(HELP_DOC)
         return 0
     
+    # Convert binary results
+    if inputs[0] in LIST__convert:
+        if len(inputs) not in [2, 3]:
+            PRINT.printE(STR__insufficient_inputs)
+            PRINT.printE(STR__use_help)
+            return 1
+        if len(inputs) == 3: path_out = inputs[2]
+        else: path_out = None
+        return Convert_Binary_Results(inputs[1], path_out)
+    
+    # Merge shard outputs
+    if inputs[0] in LIST__merge:
+        if len(inputs) < 3:
+            PRINT.printE(STR__insufficient_inputs)
+            PRINT.printE(STR__use_help)
+            return 1
+        return Merge_Shard_Outputs(inputs[1], inputs[2:])
+    
     # Initial validation
     if len(inputs) < 5:
         PRINT.printE(STR__insufficient_inputs)
@@ -825,6 +5406,16 @@ def Parse_Command_Line_Input__Pairwise_Permutation_Test(raw_command_line_input):
     raw_col_grp = inputs.pop(0)
     raw_col_data = inputs.pop(0)
     
+    # Columnar cache in place of the input file
+    columnar_path = DEFAULT__columnar_path
+    if os.path.isdir(path_in):
+        columnar_path = path_in
+        path_in = Get_Columnar_Source(columnar_path)
+        if not path_in:
+            PRINT.printE(STR__columnar_read.format(f = columnar_path))
+            PRINT.printE(STR__use_help)
+            return 1
+    
     # Validate mandatory inputs
     valid = Validate_Read_Path(path_in)
     if valid == 1:
@@ -860,14 +5451,35 @@ def Parse_Command_Line_Input__Pairwise_Permutation_Test(raw_command_line_input):
     header = DEFAULT__header
     keep = DEFAULT__keep
     col_keep = []
+    engine = DEFAULT__engine
+    block_size = DEFAULT__block_size
+    draws = DEFAULT__draws
+    budget = DEFAULT__budget
+    seed = DEFAULT__seed
+    exceedances = DEFAULT__exceedances
+    resolutions = DEFAULT__resolutions
+    cache_size = DEFAULT__cache_size
+    cache_path = DEFAULT__cache_path
+    processes = DEFAULT__processes
+    workers = DEFAULT__workers
+    queue_depth = DEFAULT__queue_depth
+    unsorted = DEFAULT__unsorted
+    index_path = DEFAULT__index_path
+    experiment_IDs = DEFAULT__experiment_IDs
+    binary = DEFAULT__binary
+    resume = DEFAULT__resume
+    store_path = DEFAULT__store_path
+    shard = DEFAULT__shard
     
     # Validate optional inputs (except output path)
     while inputs:
         arg = inputs.pop(0)
         try: # Following arguments
-            if arg in ["-o", "-t", "-d", "-k"]:
+            if arg in ["-o", "-t", "-d", "-k", "-e", "-b", "-r", "-q", "-s",
+                    "-c", "-f", "-j", "-w", "-p", "-u", "-i", "-l", "-a",
+                    "-y", "-z", "-x", "-n"]:
                 arg2 = inputs.pop(0)
-            elif arg in ["-h"]:
+            elif arg in ["-h", "-m"]:
                 arg2 = inputs.pop(0)
                 arg3 = inputs.pop(0)
             else: # Invalid
@@ -889,6 +5501,109 @@ def Parse_Command_Line_Input__Pairwise_Permutation_Test(raw_command_line_input):
                 PRINT.printE(STR__test_type.format(s = arg2))
                 PRINT.printE(STR__use_help)
                 return 1
+        elif arg == "-e":
+            if arg2 in DICT__engine:
+                engine = DICT__engine[arg2]
+            else:
+                PRINT.printE(STR__engine.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+            if engine == ENGINE.NUMPY and CRUDE_Z_TEST:
+                PRINT.printE(STR__engine_numpy)
+                return 1
+        elif arg == "-b":
+            block_size = Validate_Int_Positive(arg2)
+            if block_size == -1:
+                PRINT.printE(STR__block_size.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-m":
+            draws = Validate_Int_Positive(arg2)
+            budget = Validate_Int_Positive(arg3)
+            if draws == -1 or budget == -1:
+                PRINT.printE(STR__monte_carlo.format(s = arg2, t = arg3))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-r":
+            seed = Validate_Int_Positive(arg2)
+            if seed == -1:
+                PRINT.printE(STR__seed.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-q":
+            exceedances = Validate_Int_Positive(arg2)
+            if exceedances == -1:
+                PRINT.printE(STR__exceedances.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-c":
+            cache_size = Validate_Int_Positive(arg2)
+            if cache_size == -1:
+                PRINT.printE(STR__cache_size.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-f":
+            cache_path = arg2
+        elif arg == "-j":
+            processes = Validate_Int_Positive(arg2)
+            if processes == -1:
+                PRINT.printE(STR__processes.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-w":
+            workers = Validate_Int_Positive(arg2)
+            if workers == -1:
+                PRINT.printE(STR__workers.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-p":
+            queue_depth = Validate_Int_Positive(arg2)
+            if queue_depth == -1:
+                PRINT.printE(STR__queue_depth.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-u":
+            unsorted = Validate_Bool(arg2)
+            if unsorted == None:
+                PRINT.printE(STR__invalid_arg_for_flag.format("-u"))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-i":
+            index_path = arg2
+        elif arg == "-a":
+            columnar_path = arg2
+        elif arg == "-y":
+            binary = Validate_Bool(arg2)
+            if binary == None:
+                PRINT.printE(STR__invalid_arg_for_flag.format("-y"))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-x":
+            store_path = arg2
+        elif arg == "-n":
+            shard = Validate_Shard(arg2)
+            if not shard:
+                PRINT.printE(STR__shard.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-z":
+            resume = Validate_Bool(arg2)
+            if resume == None:
+                PRINT.printE(STR__invalid_arg_for_flag.format("-z"))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-l":
+            experiment_IDs = Validate_Experiment_IDs(arg2)
+            if not experiment_IDs:
+                PRINT.printE(STR__experiment_IDs.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
+        elif arg == "-s":
+            resolutions = Validate_Resolutions(arg2, len(col_data))
+            if not resolutions:
+                PRINT.printE(STR__resolutions.format(s = arg2))
+                PRINT.printE(STR__use_help)
+                return 1
         elif arg == "-d":
             directional = Validate_Bool(arg2)
             if directional == None:
@@ -910,8 +5625,32 @@ def Parse_Command_Line_Input__Pairwise_Permutation_Test(raw_command_line_input):
                 PRINT.printE(STR__use_help)
                 return 1
     
-    # Validate output path
-    if path_out:
+    # Validate binary output
+    if binary and not path_out:
+        PRINT.printE(STR__binary_output)
+        PRINT.printE(STR__use_help)
+        return 1
+    
+    # Validate resume
+    if resume and not path_out:
+        PRINT.printE(STR__resume_output)
+        PRINT.printE(STR__use_help)
+        return 1
+    
+    # Validate columnar cache
+    if columnar_path and CRUDE_Z_TEST:
+        PRINT.printE(STR__columnar_numpy)
+        return 1
+    
+    # Validate parallelism
+    if processes > 1 and workers > 1:
+        PRINT.printE(STR__workers_exclusive)
+        PRINT.printE(STR__use_help)
+        return 1
+    
+    # Validate output path (Unless it is to be continued from a journal)
+    journaled = os.path.exists(str(path_out) + STR__journal_suffix)
+    if path_out and not (resume and journaled):
         valid_out = Validate_Write_Path__FILE(path_out)
         if valid_out == 2: return 0
         if valid_out == 3:
@@ -924,7 +5663,10 @@ def Parse_Command_Line_Input__Pairwise_Permutation_Test(raw_command_line_input):
     # Run program
     exit_state = Exhaustive_Pairwise_Permutation_Test(path_in,delim,col_exp,
             col_grp,col_data,path_out,test_type,directional,header,keep,
-            col_keep)
+            col_keep,engine,block_size,draws,budget,seed,exceedances,
+            resolutions,cache_size,cache_path,processes,workers,queue_depth,
+            unsorted,index_path,experiment_IDs,columnar_path,binary,resume,
+            store_path,shard)
     
     # Safe exit
     if exit_state == 0: return 0
@@ -934,6 +5676,65 @@ def Parse_Command_Line_Input__Pairwise_Permutation_Test(raw_command_line_input):
 
 
 
+def Validate_Resolutions(string, length):
+    """
+    Validates the resolutions of the data columns. Return a list of
+    @length positive numbers if the resolutions are valid. Return None
+    otherwise.
+    
+    A single resolution is used for every data column.
+    
+    Validate_Resolutions(str, int) -> list<float>
+    Validate_Resolutions(str, int) -> None
+    """
+    try:
+        resolutions = [float(value) for value in string.split(",")]
+    except:
+        return None
+    if len(resolutions) == 1: resolutions = resolutions * length
+    if len(resolutions) != length: return None
+    for resolution in resolutions:
+        if not resolution > 0: return None
+    return resolutions
+
+def Validate_Experiment_IDs(string):
+    """
+    Validates a comma separated list of experiment IDs. Return the experiment
+    IDs as a list, without duplicates, in the order given. Return an empty
+    list if any of the experiment IDs are empty.
+    
+    @string
+            (str)
+            The comma separated list of experiment IDs.
+    
+    Validate_Experiment_IDs(str) -> list<str>
+    """
+    result = []
+    for exp_ID in string.split(","):
+        if not exp_ID: return []
+        if exp_ID not in result:
+            result.append(exp_ID)
+    return result
+
+def Validate_Shard(string):
+    """
+    Validates a shard, written as "i/N". Return the shard number and the number
+    of shards as a list of two integers, or an empty list if the shard is
+    invalid.
+    
+    @string
+            (str)
+            The shard.
+    
+    Validate_Shard(str) -> list<int>
+    """
+    values = string.split("/")
+    if len(values) != 2: return []
+    shard = Validate_Int_Positive(values[0])
+    shards = Validate_Int_Positive(values[1])
+    if shard == -1 or shards == -1 or shard > shards: return []
+    return [shard, shards]
+
 def Validate_Write_Path__FILE(filepath):
     """
     Validates the filepath of the output file.